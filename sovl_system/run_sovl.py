@@ -9,12 +9,9 @@ import atexit
 import time
 import functools
 import threading
-import asyncio
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
-from collections import defaultdict
 
 # Core system imports
 from sovl_main import SystemContext, SOVLSystem
@@ -30,7 +27,7 @@ from sovl_utils import (
     safe_compare, memory_usage, log_memory_usage, dynamic_batch_size,
     detect_repetitions, adjust_temperature, synchronized,
     validate_components, sync_component_states, validate_component_states,
-    initialize_component_state
+    initialize_component_state, make_adamw
 )
 from sovl_logger import Logger, LoggerConfig
 from sovl_config import ConfigManager
@@ -114,6 +111,7 @@ class SOVLRunner:
         self.scaffold_model = None
         # Add checkpoint lock for concurrency protection
         self._checkpoint_lock = threading.Lock()
+        self._checkpoint_thread: Optional[threading.Thread] = None
         
     @staticmethod
     def _setup_logger() -> Logger:
@@ -447,7 +445,7 @@ class SOVLRunner:
             
             # Initialize optimizer
             if optimizer_type.lower() == "adamw":
-                self.optimizer = torch.optim.AdamW(
+                self.optimizer = make_adamw(
                     model.parameters(),
                     lr=learning_rate,
                     weight_decay=weight_decay
@@ -505,7 +503,7 @@ class SOVLRunner:
             
             # Cleanup model manager and model
             if hasattr(self, "model_manager") and self.model_manager:
-                self.model_manager.cleanup()
+                self.model_manager.shutdown()
                 self.model = None
                 if hasattr(self, "tokenizer"):
                     self.tokenizer = None
@@ -644,31 +642,29 @@ class SOVLRunner:
             print(f"Error: {str(e)}")
             return False
     
-    @error_handler
-    async def _async_save_checkpoint(self, optimizer: Optional[torch.optim.Optimizer] = None) -> bool:
-        """Asynchronously save system checkpoint with concurrency protection and non-blocking I/O."""
+    def _snapshot_to_cpu(self, value: Any) -> Any:
+        """Copy every tensor in a (possibly nested) state dict to CPU so training can keep mutating the originals."""
+        if isinstance(value, torch.Tensor):
+            if value.is_cuda:
+                # Device-to-host copies into pinned memory; completed by a single synchronize
+                return value.detach().to("cpu", non_blocking=True)
+            return value.detach().clone()
+        if isinstance(value, dict):
+            return {k: self._snapshot_to_cpu(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(self._snapshot_to_cpu(v) for v in value)
+        return value
+
+    def _write_checkpoint(self, checkpoint_data: Dict[str, Any], current_time: float) -> bool:
+        """Serialize a CPU checkpoint snapshot to disk with an atomic rename."""
         import uuid
-        from concurrent.futures import ThreadPoolExecutor
-        current_time = time.time()
-        checkpoint_data = {
-            "version": "1.0",  # Add versioning for future format changes
-            "timestamp": current_time,
-            "model_state": self.model.state_dict(),
-            "optimizer_state": optimizer.state_dict() if optimizer else None,
-            "component_states": {
-                name: comp.to_dict() for name, comp in self.components.items()
-                if self._validate_component_serialization(comp, name)
-            }
-        }
         temp_path = Path("checkpoints") / f"temp_{current_time}_{uuid.uuid4().hex}.pt"
         final_path = Path("checkpoints") / f"checkpoint_{current_time}.pt"
-        loop = asyncio.get_running_loop()
         try:
             with self._checkpoint_lock:
-                # Save to temporary file in a thread pool
-                await loop.run_in_executor(None, torch.save, checkpoint_data, temp_path)
-                # Atomic rename in a thread pool
-                await loop.run_in_executor(None, temp_path.rename, final_path)
+                torch.save(checkpoint_data, temp_path)
+                temp_path.rename(final_path)
+                # Only a completed write resets the interval, so a failed one is retried on the next call
                 self.last_checkpoint_time = current_time
                 self.logger.log_event(
                     event_type="checkpoint",
@@ -683,6 +679,42 @@ class SOVLRunner:
             )
             return False
 
+    @error_handler
+    def _save_checkpoint_in_background(self, optimizer: Optional[torch.optim.Optimizer] = None, wait: bool = False) -> bool:
+        """Snapshot state to CPU on the calling thread, then write it from a background thread (at most one in flight)."""
+        if self._checkpoint_thread is not None and self._checkpoint_thread.is_alive():
+            if not wait:
+                self.logger.log_event(
+                    event_type="checkpoint",
+                    message="Previous checkpoint still being written; skipping this save",
+                    level="info"
+                )
+                return False
+            self._checkpoint_thread.join()
+        current_time = time.time()
+        checkpoint_data = {
+            "version": "1.0",  # Add versioning for future format changes
+            "timestamp": current_time,
+            "model_state": self._snapshot_to_cpu(self.model.state_dict()),
+            "optimizer_state": self._snapshot_to_cpu(optimizer.state_dict()) if optimizer else None,
+            "component_states": {
+                name: comp.to_dict() for name, comp in self.components.items()
+                if self._validate_component_serialization(comp, name)
+            }
+        }
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
+        if wait:
+            return self._write_checkpoint(checkpoint_data, current_time)
+        self._checkpoint_thread = threading.Thread(
+            target=self._write_checkpoint,
+            args=(checkpoint_data, current_time),
+            name="sovl-checkpoint-writer",
+            daemon=True
+        )
+        self._checkpoint_thread.start()
+        return True
+
     def _validate_checkpoint(self, checkpoint_data: Dict[str, Any]) -> bool:
         """Validate checkpoint data structure and compatibility."""
         try:
@@ -735,7 +767,7 @@ class SOVLRunner:
 
     @error_handler
     def save_checkpoint(self, force: bool = False, optimizer: Optional[torch.optim.Optimizer] = None) -> bool:
-        """Save system state checkpoint with async support."""
+        """Save system state checkpoint; disk writes run in the background unless forced."""
         if not force and self.last_checkpoint_time is not None:
             if time.time() - self.last_checkpoint_time < self.checkpoint_interval:
                 return False
@@ -747,8 +779,8 @@ class SOVLRunner:
                 level="info"
             )
             
-            # Run async save
-            return asyncio.run(self._async_save_checkpoint(optimizer))
+            # Forced saves (e.g. on shutdown) block until the file is on disk
+            return self._save_checkpoint_in_background(optimizer, wait=force)
             
         except Exception as e:
             self.logger.log_error(
@@ -910,11 +942,16 @@ class SOVLRunner:
             )
             
             self.model.eval()
-            metrics = defaultdict(float)
-            total_batches = 0
+            # Per-batch losses stay on the device; reading them back once at the end
+            # avoids a host sync per batch
+            batch_losses = []
             
-            # Initialize gradient scaler for mixed precision
-            scaler = torch.cuda.amp.GradScaler()
+            # With AMP enabled, prefer bf16 autocast: it keeps the fp32 exponent range, so no gradient
+            # scaler is ever needed; fall back to fp16 on GPUs without bf16 support
+            device_type = torch.device(self.context.device).type
+            amp_dtype = None
+            if device_type == "cuda" and self.context.config_manager.get("training.use_amp", False):
+                amp_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
             
             with torch.no_grad():
                 for i in range(0, len(valid_data), batch_size):
@@ -923,22 +960,21 @@ class SOVLRunner:
                         continue
                         
                     # Use automatic mixed precision
-                    with torch.cuda.amp.autocast():
+                    with torch.autocast(device_type=device_type, dtype=amp_dtype, enabled=amp_dtype is not None):
                         inputs = self._prepare_batch(batch)
                         outputs = self.model(**inputs)
                         loss = self._calculate_loss(outputs, inputs)
                         
                     # Update metrics
-                    metrics["loss"] += loss.item()
-                    total_batches += 1
+                    batch_losses.append(loss.detach())
                     
                     # Clear cache periodically
                     if i % (batch_size * 10) == 0:
                         torch.cuda.empty_cache()
                         
             # Calculate average metrics
-            if total_batches > 0:
-                return {k: v/total_batches for k, v in metrics.items()}
+            if batch_losses:
+                return {"loss": torch.stack(batch_losses).float().mean().item()}
             return {}
             
         except Exception as e:
@@ -950,52 +986,37 @@ class SOVLRunner:
 
     @error_handler
     def _prepare_batch(self, batch: List[Dict[str, Any]]) -> Dict[str, torch.Tensor]:
-        """Prepare batch for model input with parallel processing. Always includes labels."""
+        """Prepare batch for model input. Always includes labels."""
         if self.tokenizer is None:
             raise ValueError("Tokenizer not initialized")
         if not batch or "text" not in batch[0]:
             raise ValueError("Each batch item must contain a 'text' field.")
-        # Extract texts for parallel processing
+        max_seq_length = self.context.config_manager.get("training.max_seq_length", 512)
+        # Tokenize the whole batch in one call; fast tokenizers parallelize internally
         texts = [item["text"] for item in batch]
-        # Use thread pool for parallel tokenization
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            tokenized = list(executor.map(
-                lambda text: self.tokenizer(
-                    text,
-                    truncation=True,
-                    max_length=self.context.config_manager.get("training.max_seq_length", 512)
-                ),
-                texts
-            ))
+        tokenized = self.tokenizer(texts, truncation=True, max_length=max_seq_length)["input_ids"]
         # Find maximum sequence length in batch
-        max_length = max(len(t["input_ids"]) for t in tokenized)
+        max_length = max(len(ids) for ids in tokenized)
         batch_size = len(tokenized)
         # Initialize tensors with padding
         input_ids = torch.full((batch_size, max_length), self.tokenizer.pad_token_id)
         attention_mask = torch.zeros((batch_size, max_length))
         # Fill tensors with tokenized data
-        for i, tokens in enumerate(tokenized):
-            length = len(tokens["input_ids"])
-            input_ids[i, :length] = torch.tensor(tokens["input_ids"])
+        for i, ids in enumerate(tokenized):
+            length = len(ids)
+            input_ids[i, :length] = torch.tensor(ids)
             attention_mask[i, :length] = 1
         # Prepare labels
         if "labels" in batch[0]:
             label_texts = [item["labels"] for item in batch]
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                tokenized_labels = list(executor.map(
-                    lambda text: self.tokenizer(
-                        text,
-                        truncation=True,
-                        max_length=self.context.config_manager.get("training.max_seq_length", 512)
-                    ),
-                    label_texts
-                ))
+            tokenized_labels = self.tokenizer(label_texts, truncation=True, max_length=max_seq_length)["input_ids"]
             labels = torch.full((batch_size, max_length), -100)  # -100 for ignored positions
-            for i, tokens in enumerate(tokenized_labels):
-                length = min(len(tokens["input_ids"]), max_length)
-                labels[i, :length] = torch.tensor(tokens["input_ids"][:length])
+            for i, ids in enumerate(tokenized_labels):
+                length = min(len(ids), max_length)
+                labels[i, :length] = torch.tensor(ids[:length])
         else:
-            labels = input_ids.clone()
+            # Single masked copy of the inputs; padded positions are ignored by the loss
+            labels = input_ids.masked_fill(attention_mask == 0, -100)
         # Move tensors to appropriate device
         device = self.context.device
         return {
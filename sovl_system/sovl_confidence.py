@@ -2,6 +2,7 @@ from typing import Optional, Dict, Any, List, Tuple
 import torch
 from threading import Lock
 from collections import deque
+from itertools import islice
 from sovl_logger import Logger
 import traceback
 from sovl_state import StateManager
@@ -302,8 +303,9 @@ class ConfidenceCalculator:
             c = max(self.min_confidence, min(self.max_confidence, confidence))
             if hasattr(s, 'confidence_history') and isinstance(s.confidence_history, deque):
                 s.confidence_history.append(c)
-                while len(s.confidence_history) > 100:
-                    s.confidence_history.popleft()
+                if s.confidence_history.maxlen is None:
+                    while len(s.confidence_history) > 100:
+                        s.confidence_history.popleft()
             else:
                 s.confidence_history = deque([c], maxlen=100)
             return s
@@ -333,7 +335,7 @@ class ConfidenceCalculator:
                     }
                 )
                 return self.default_confidence
-            recent_confidences = list(state.confidence_history)[-self.min_history_length:]
+            recent_confidences = list(islice(reversed(state.confidence_history), self.min_history_length))[::-1]
             valid_confidences = [
                 c for c in recent_confidences
                 if isinstance(c, (int, float)) and self.min_confidence <= c <= self.max_confidence
@@ -1,9 +1,11 @@
 import json
 import os
+import sys
 import gzip
 import hashlib
 from typing import Any, Optional, Dict, List, Union, Callable, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field as dataclass_field
+from types import MappingProxyType
 from threading import Lock
 import traceback
 import time
@@ -14,10 +16,41 @@ import tempfile
 import shutil
 from sovl_utils import set_nested_dict_value, get_nested_dict_value
 
+def _freeze_default(value: Any) -> Any:
+    """Recursively convert list/dict defaults to tuple/MappingProxyType so shared schemas can't be mutated."""
+    if type(value) is str:
+        return sys.intern(value)
+    if isinstance(value, list):
+        return tuple(_freeze_default(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze_default(item) for key, item in value.items()})
+    return value
+
+def _thaw_default(value: Any) -> Any:
+    """Inverse of _freeze_default: build a fresh, mutable list/dict copy."""
+    if isinstance(value, tuple):
+        return [_thaw_default(item) for item in value]
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw_default(item) for key, item in value.items()}
+    return value
+
+def _range_check(bounds: Optional[tuple]) -> Optional[Callable[[Any], bool]]:
+    """Return a bounds check specialized for which of (min, max) are set, or None if unbounded."""
+    if bounds is None:
+        return None
+    low, high = bounds
+    if low is None and high is None:
+        return None
+    if high is None:
+        return lambda value: low <= value
+    if low is None:
+        return lambda value: value <= high
+    return lambda value: low <= value <= high
+
 # ConfigSchema defines validation rules and defaults for configuration fields.
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConfigSchema:
-    """Defines validation rules for configuration fields."""
+    """Defines validation rules for configuration fields. Immutable, so schema instances can be shared freely."""
     field: str
     type: type
     default: Any = None
@@ -25,6 +58,19 @@ class ConfigSchema:
     range: Optional[tuple] = None
     required: bool = False
     nullable: bool = False
+    description: Optional[str] = None
+    range_check: Optional[Callable[[Any], bool]] = dataclass_field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Dotted paths repeat across lookups and dict keys, so share one copy of each
+        object.__setattr__(self, "field", sys.intern(self.field))
+        # Schemas are built once and shared, so mutable defaults are stored frozen
+        object.__setattr__(self, "default", _freeze_default(self.default))
+        object.__setattr__(self, "range_check", _range_check(self.range))
+
+    def default_value(self) -> Any:
+        """Return the default as a fresh mutable copy, safe to hand out to config consumers."""
+        return _thaw_default(self.default)
 
 # SchemaValidator checks config values against schemas and logs issues.
 class SchemaValidator:
@@ -43,57 +89,61 @@ class SchemaValidator:
     def validate(self, key: str, value: Any, conversation_id: str = "init") -> tuple[bool, Any]:
         """Validate a value against its schema with thread safety and error logging."""
         with self._lock:
-            schema = self.schemas.get(key)
-            if not schema:
-                self.logger.record({
-                    "error": f"Unknown configuration key: {key}",
-                    "timestamp": time.time(),
-                    "conversation_id": conversation_id
-                })
-                return False, None
-
-            if value is None:
-                if schema.required:
-                    self.logger.record({
-                        "error": f"Required field {key} is missing",
-                        "suggested": f"Set to default: {schema.default}",
-                        "timestamp": time.time(),
-                        "conversation_id": conversation_id
-                    })
-                    return False, schema.default
-                if schema.nullable:
-                    return True, value
-                return False, schema.default
-
-            if not isinstance(value, schema.type):
-                self.logger.record({
-                    "warning": f"Invalid type for {key}: expected {schema.type.__name__}, got {type(value).__name__}",
-                    "suggested": f"Set to default: {schema.default}",
-                    "timestamp": time.time(),
-                    "conversation_id": conversation_id
-                })
-                return False, schema.default
-
-            if schema.validator and not schema.validator(value):
-                valid_options = getattr(schema.validator, '__doc__', '') or str(schema.validator)
-                self.logger.record({
-                    "warning": f"Invalid value for {key}: {value}",
-                    "suggested": f"Valid options: {valid_options}, default: {schema.default}",
-                    "timestamp": time.time(),
-                    "conversation_id": conversation_id
-                })
-                return False, schema.default
+            return self._validate_locked(key, value, conversation_id)
+
+    def _validate_locked(self, key: str, value: Any, conversation_id: str) -> tuple[bool, Any]:
+        """Validate a single value; the caller must hold self._lock."""
+        schema = self.schemas.get(key)
+        if not schema:
+            self.logger.record({
+                "error": f"Unknown configuration key: {key}",
+                "timestamp": time.time(),
+                "conversation_id": conversation_id
+            })
+            return False, None
 
-            if schema.range and not (schema.range[0] <= value <= schema.range[1] if schema.range[1] is not None else schema.range[0] <= value):
+        if value is None:
+            if schema.required:
                 self.logger.record({
-                    "warning": f"Value for {key} out of range {schema.range}: {value}",
-                    "suggested": f"Set to default: {schema.default}",
+                    "error": f"Required field {key} is missing",
+                    "suggested": f"Set to default: {schema.default_value()}",
                     "timestamp": time.time(),
                     "conversation_id": conversation_id
                 })
-                return False, schema.default
+                return False, schema.default_value()
+            if schema.nullable:
+                return True, value
+            return False, schema.default_value()
+
+        if not isinstance(value, schema.type):
+            self.logger.record({
+                "warning": f"Invalid type for {key}: expected {schema.type.__name__}, got {type(value).__name__}",
+                "suggested": f"Set to default: {schema.default_value()}",
+                "timestamp": time.time(),
+                "conversation_id": conversation_id
+            })
+            return False, schema.default_value()
+
+        if schema.validator and not schema.validator(value):
+            valid_options = getattr(schema.validator, '__doc__', '') or str(schema.validator)
+            self.logger.record({
+                "warning": f"Invalid value for {key}: {value}",
+                "suggested": f"Valid options: {valid_options}, default: {schema.default_value()}",
+                "timestamp": time.time(),
+                "conversation_id": conversation_id
+            })
+            return False, schema.default_value()
+
+        if schema.range_check is not None and not schema.range_check(value):
+            self.logger.record({
+                "warning": f"Value for {key} out of range {schema.range}: {value}",
+                "suggested": f"Set to default: {schema.default_value()}",
+                "timestamp": time.time(),
+                "conversation_id": conversation_id
+            })
+            return False, schema.default_value()
 
-            return True, value
+        return True, value
 
     def validate_batch(self, items: Dict[str, Any], conversation_id: str = "init") -> Tuple[bool, Dict[str, Any], Dict[str, Any]]:
         """
@@ -102,13 +152,15 @@ class SchemaValidator:
         all_valid = True
         valid_items = {}
         invalid_items = {}
-        for key, value in items.items():
-            valid, corrected = self.validate(key, value, conversation_id)
-            if valid:
-                valid_items[key] = value
-            else:
-                all_valid = False
-                invalid_items[key] = corrected
+        # One lock acquisition for the whole batch instead of one per item
+        with self._lock:
+            for key, value in items.items():
+                valid, corrected = self._validate_locked(key, value, conversation_id)
+                if valid:
+                    valid_items[key] = value
+                else:
+                    all_valid = False
+                    invalid_items[key] = corrected
         return all_valid, valid_items, invalid_items
 
     def required_keys_missing(self, required_keys: List[str], config: Dict[str, Any]) -> List[str]:
@@ -177,12 +229,12 @@ class ConfigStore:
         """Rebuild structured config from flat config with thread safety."""
         with self._lock:
             for schema in schemas:
-                set_nested_dict_value(self.structured_config, schema.field, self.get_value(schema.field, schema.default))
+                set_nested_dict_value(self.structured_config, schema.field, self.get_value(schema.field, schema.default_value()))
 
     def update_cache(self, schemas: List[ConfigSchema]) -> None:
         """Update cache with current config values with thread safety."""
         with self._lock:
-            self.cache = {schema.field: self.get_value(schema.field, schema.default) for schema in schemas}
+            self.cache = {schema.field: self.get_value(schema.field, schema.default_value()) for schema in schemas}
 
 # FileHandler loads and saves configuration files with retry logic.
 class FileHandler:
@@ -305,12 +357,7 @@ class ConfigManager:
 
     def _load_schema(self) -> List[ConfigSchema]:
         """Load schema from ValidationSchema and flatten to a list for validation."""
-        schema_dict = ValidationSchema.get_schema()
-        flat_schema = []
-        for section, fields in schema_dict.items():
-            for field, config_schema in fields.items():
-                flat_schema.append(config_schema)
-        return flat_schema
+        return list(ValidationSchema.get_flat_schema().values())
 
     def _initialize_config(self) -> None:
         """Initialize configuration from file."""
@@ -335,15 +382,17 @@ class ConfigManager:
             return ""
 
     def _validate_and_set_defaults(self) -> None:
-        for schema in self._load_schema():
-            value = self.store.get_value(schema.field, schema.default)
-            is_valid, corrected_value = self.validator.validate(schema.field, value)
-            if not is_valid:
-                self.store.set_value(schema.field, corrected_value)
-                self._log_event("config_validation", f"Set default value for {schema.field}", "warning", {
-                    "field": schema.field,
-                    "default_value": corrected_value
-                })
+        values = {
+            schema.field: self.store.get_value(schema.field, schema.default_value())
+            for schema in self._load_schema()
+        }
+        _, _, invalid_items = self.validator.validate_batch(values)
+        for field, corrected_value in invalid_items.items():
+            self.store.set_value(field, corrected_value)
+            self._log_event("config_validation", f"Set default value for {field}", "warning", {
+                "field": field,
+                "default_value": corrected_value
+            })
 
     def _log_event(self, event_type: str, message: str, level: str, additional_info: Dict[str, Any] = None) -> None:
         self.logger.record_event(event_type=event_type, message=message, level=level, additional_info=additional_info or {})
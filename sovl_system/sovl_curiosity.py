@@ -921,14 +921,15 @@ class CuriosityManager():
         seen_prompts = getattr(state, 'seen_prompts', [])
         if not seen_prompts:
             return 1.0
-        similarities = [
-            cosine_similarity(
-                self.state_manager.get_prompt_embedding(prompt),
-                self.state_manager.get_prompt_embedding(seen)
-            )
-            for seen in seen_prompts
-        ]
-        return 1.0 - max(similarities) if similarities else 1.0
+        # Embed the prompt once rather than once per seen prompt
+        prompt_embedding = self.state_manager.get_prompt_embedding(prompt)
+        # Stack the seen embeddings so a single broadcast call scores them all,
+        # normalizing the prompt once instead of once per seen prompt
+        seen_embeddings = torch.stack([
+            self.state_manager.get_prompt_embedding(seen) for seen in seen_prompts
+        ])
+        similarities = cosine_similarity(prompt_embedding, seen_embeddings)
+        return 1.0 - similarities.max().item()
 
     def _calculate_ignorance(self, prompt: str) -> float:
         """Calculate ignorance as 1.0 - similarity to best long-term memory match."""
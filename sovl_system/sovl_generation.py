@@ -470,18 +470,23 @@ class GenerationManager:
     def has_repetition(self, output_ids: torch.Tensor, n: int = 3) -> bool:
         """Check for repetition in generated output."""
         try:
-            ids = output_ids.tolist()
-            special_ids = {
-                self.base_tokenizer.pad_token_id,
-                self.base_tokenizer.eos_token_id,
-                self.base_tokenizer.bos_token_id,
-                self.base_tokenizer.unk_token_id
-            }
-            filtered = [i for i in ids if i not in special_ids]
-            for i in range(len(filtered) - 2 * n):
-                if filtered[i:i + n] == filtered[i + n:i + 2 * n]:
-                    return True
-            return False
+            ids = output_ids.detach().cpu()
+            special_ids = [
+                token_id for token_id in (
+                    self.base_tokenizer.pad_token_id,
+                    self.base_tokenizer.eos_token_id,
+                    self.base_tokenizer.bos_token_id,
+                    self.base_tokenizer.unk_token_id
+                ) if token_id is not None
+            ]
+            if special_ids:
+                ids = ids[~torch.isin(ids, torch.tensor(special_ids, dtype=ids.dtype))]
+            # Compare every n-gram window with the one starting n tokens later in a single pass
+            num_starts = ids.numel() - 2 * n
+            if num_starts <= 0:
+                return False
+            windows = ids.unfold(0, n, 1)
+            return bool((windows[:num_starts] == windows[n:n + num_starts]).all(dim=1).any())
         except Exception as e:
             self._handle_error("has_repetition", e)
             return False
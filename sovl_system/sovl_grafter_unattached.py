@@ -270,7 +270,7 @@ class PluginManager:
                     self.config_manager.register_schema(metadata.config_requirements)
                     for schema in metadata.config_requirements:
                         if not self.config_manager.get(schema.field, None):
-                            self.config_manager.update(schema.field, schema.default)
+                            self.config_manager.update(schema.field, schema.default_value())
 
                 self.plugins[metadata.name] = plugin
                 self._update_state_hash()
@@ -624,7 +624,7 @@ class PluginManager:
                                 "conversation_id": self.state.history.conversation_id
                             })
                             return False
-                        if schema.range and not (schema.range[0] <= value <= schema.range[1]):
+                        if schema.range_check is not None and not schema.range_check(value):
                             self.logger.record({
                                 "warning": f"Value for {schema.field} out of range {schema.range}: {value}",
                                 "timestamp": time.time(),
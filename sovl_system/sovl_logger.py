@@ -4,8 +4,10 @@ import gzip
 import uuid
 import time
 import logging
+import queue
+import atexit
 from datetime import datetime
-from threading import Lock, RLock
+from threading import Lock, RLock, Thread
 from typing import List, Dict, Union, Optional, Callable, Any, Tuple, Literal
 from dataclasses import dataclass, field
 import traceback
@@ -275,9 +277,9 @@ class _FileHandler:
             return
 
         try:
+            payload = "".join(json.dumps(entry) + '\n' for entry in valid_entries)
             with self.safe_file_op(open, self.config.log_file, 'a') as f:
-                for entry in valid_entries:
-                    f.write(json.dumps(entry) + '\n')
+                f.write(payload)
         except Exception as e:
             self.fallback_logger.error(f"Error writing batch: {str(e)}")
 
@@ -313,6 +315,8 @@ class Logger(IErrorHandler):
         "ERROR": 40,
         "CRITICAL": 50
     }
+    _MAX_PENDING_ENTRIES = 1024  # Events queued for the writer thread before recording callers block
+    _WRITE_BATCH_SIZE = 64  # Events written per file open by the writer thread
     
     def __new__(cls):
         with cls._lock:
@@ -324,6 +328,7 @@ class Logger(IErrorHandler):
         if not hasattr(self, '_initialized'):
             self._initialized = True
             self._lock = RLock()
+            self._write_lock = Lock()  # Guards the log file itself; the writer thread never takes _lock
             # Set LOGGING_ENABLED from config if available
             if config_manager is not None:
                 set_logging_enabled_from_config(config_manager)
@@ -344,6 +349,13 @@ class Logger(IErrorHandler):
             self._validator = _LogValidator(self._fallback_logger)
             self._file_handler = _FileHandler(self.config, self._fallback_logger)
             
+            # Every entry is written in batches by a background thread, in the order it was recorded;
+            # callers only pay for an enqueue
+            self._pending_entries = queue.Queue(maxsize=self._MAX_PENDING_ENTRIES)
+            self._writer_thread = Thread(target=self._drain_entries, name="sovl-log-writer", daemon=True)
+            self._writer_thread.start()
+            atexit.register(self.flush)
+            
             # Register with ErrorRecordBridge
             ErrorRecordBridge().register_handler(self)
             
@@ -368,62 +380,89 @@ class Logger(IErrorHandler):
         """Record a general system event."""
         if not LOGGING_ENABLED or not self.should_log(level):
             return
-        with self._lock:
+        try:
+            log_entry = {
+                'timestamp': datetime.now().isoformat(),
+                'conversation_id': str(uuid.uuid4()),
+                'event_type': event_type,
+                'message': message,
+                'level': level,
+                **(additional_info or {})
+            }
+            with self._lock:
+                valid = self._validator.validate_entry(log_entry)
+            if valid:
+                # Enqueued outside _lock: put() blocks while the writer is behind, and other
+                # threads must still be able to record, update config or clean up meanwhile
+                self._pending_entries.put(log_entry)
+            else:
+                self._fallback_logger.warning(f"Invalid log entry skipped: {log_entry}")
+        except Exception as e:
+            self._fallback_logger.error(f"Failed to record event: {str(e)}")
+            self._fallback_logger.error(traceback.format_exc())
+    
+    def _drain_entries(self) -> None:
+        """Writer thread: pull queued events and write them in batches."""
+        while True:
+            entries = [self._pending_entries.get()]
+            while len(entries) < self._WRITE_BATCH_SIZE:
+                try:
+                    entries.append(self._pending_entries.get_nowait())
+                except queue.Empty:
+                    break
             try:
-                log_entry = {
-                    'timestamp': datetime.now().isoformat(),
-                    'conversation_id': str(uuid.uuid4()),
-                    'event_type': event_type,
-                    'message': message,
-                    'level': level,
-                    **(additional_info or {})
-                }
-                if self._validator.validate_entry(log_entry):
-                    self._file_handler.write_batch([log_entry])
-                else:
-                    self._fallback_logger.warning(f"Invalid log entry skipped: {log_entry}")
+                with self._write_lock:
+                    self._file_handler.write_batch(entries)
             except Exception as e:
-                self._fallback_logger.error(f"Failed to record event: {str(e)}")
-                self._fallback_logger.error(traceback.format_exc())
+                self._fallback_logger.error(f"Failed to write queued events: {str(e)}")
+            finally:
+                for _ in entries:
+                    self._pending_entries.task_done()
+    
+    def flush(self) -> None:
+        """Block until every queued event has been written to the log file."""
+        self._pending_entries.join()
     
     def handle_error(self, record: ErrorRecord) -> None:
         """Handle error records from the ErrorRecordBridge."""
         if not LOGGING_ENABLED or not self.should_log("ERROR"):
             return
-        with self._lock:
-            try:
-                # Construct error log entry
-                error_entry = {
-                    'timestamp': datetime.now().isoformat(),
-                    'conversation_id': str(uuid.uuid4()),
-                    'event_type': 'error',
-                    'message': record.error_message,
-                    'level': 'error',
-                    'error_type': record.error_type,
-                    'stack_trace': record.stack_trace,
-                    **(record.additional_info or {})
-                }
-                # Write error to log file
-                if self._validator.validate_entry(error_entry):
-                    self._file_handler.write_batch([error_entry])
-                else:
-                    self._fallback_logger.warning(f"Invalid error entry skipped: {error_entry}")
-            except Exception as e:
-                self._fallback_logger.error(f"Failed to handle error: {str(e)}")
-                self._fallback_logger.error(traceback.format_exc())
+        try:
+            # Construct error log entry
+            error_entry = {
+                'timestamp': datetime.now().isoformat(),
+                'conversation_id': str(uuid.uuid4()),
+                'event_type': 'error',
+                'message': record.error_message,
+                'level': 'error',
+                'error_type': record.error_type,
+                'stack_trace': record.stack_trace,
+                **(record.additional_info or {})
+            }
+            with self._lock:
+                valid = self._validator.validate_entry(error_entry)
+            if valid:
+                # Queued like any other event so errors stay in order with earlier records; as in
+                # record_event, the possibly blocking put happens after _lock is released
+                self._pending_entries.put(error_entry)
+            else:
+                self._fallback_logger.warning(f"Invalid error entry skipped: {error_entry}")
+        except Exception as e:
+            self._fallback_logger.error(f"Failed to handle error: {str(e)}")
+            self._fallback_logger.error(traceback.format_exc())
     
     def log_error(self, error_msg: str, error_type: str = None, stack_trace: str = None, additional_info: Dict[str, Any] = None) -> None:
         """Log an error with detailed information."""
         if not LOGGING_ENABLED:
             return
-        with self._lock:
-            # Record through the bridge
-            ErrorRecordBridge().record_error(
-                error_type=error_type or "unknown_error",
-                error_message=error_msg,
-                stack_trace=stack_trace,
-                additional_info=additional_info
-            )
+        # Record through the bridge, which serializes itself; holding _lock here would put
+        # handle_error's enqueue back under it
+        ErrorRecordBridge().record_error(
+            error_type=error_type or "unknown_error",
+            error_message=error_msg,
+            stack_trace=stack_trace,
+            additional_info=additional_info
+        )
     
     def get_error_stats(self) -> Dict[str, Any]:
         """Get error statistics."""
@@ -439,7 +478,8 @@ class Logger(IErrorHandler):
         """Clean up logging resources."""
         if not LOGGING_ENABLED:
             return
-        with self._lock:
+        self.flush()
+        with self._lock, self._write_lock:
             try:
                 self._file_handler.manage_rotation()
                 self._file_handler.compress_logs()
@@ -455,7 +495,8 @@ class Logger(IErrorHandler):
             try:
                 self.config.update(**kwargs)
                 # Reinitialize file handler with new config
-                self._file_handler = _FileHandler(self.config, self._fallback_logger)
+                with self._write_lock:
+                    self._file_handler = _FileHandler(self.config, self._fallback_logger)
             except Exception as e:
                 self._fallback_logger.error(f"Failed to update logger config: {str(e)}")
                 self._fallback_logger.error(traceback.format_exc())
\ No newline at end of file
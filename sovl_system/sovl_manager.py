@@ -1,21 +1,68 @@
 import torch
 import torch.nn as nn
-from transformers import AutoModelForCausalLM, AutoTokenizer, AutoConfig
-from peft import LoraConfig, get_peft_model, TaskType
+from transformers import AutoModelForCausalLM, AutoTokenizer, AutoConfig, BitsAndBytesConfig
+from transformers.quantizers import AutoHfQuantizer
+from peft import LoraConfig, get_peft_model, TaskType, set_peft_model_state_dict
+from safetensors import safe_open
+from safetensors.torch import load_file as load_safetensors
+from huggingface_hub import get_safetensors_metadata, snapshot_download
 import bitsandbytes as bnb
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Collection, Union
+import copy
 import traceback
 import os
-from threading import Lock
+from threading import Lock, RLock, local
 import time
 from functools import wraps
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from sovl_utils import validate_quantization_mode
 from sovl_config import ConfigManager
+import sovl_logger
 from sovl_logger import Logger
 from sovl_error import ErrorManager, ErrorRecord
 import gc
+from collections import OrderedDict, namedtuple
 from sovl_resource import ResourceManager
 
+# Quantization modes accepted by model_config.quantization_mode
+_QUANTIZATION_MODES = frozenset({"int4", "int8", "fp16"})
+# Approximate bytes per parameter for each quantization mode
+_BYTES_PER_PARAM = {"fp16": 2.0, "int8": 1.0, "int4": 0.5}
+# Files fetched when prefetching model snapshots (weights, configs, tokenizer assets)
+_SNAPSHOT_PATTERNS = ["*.safetensors", "*.json", "*.txt", "*.model", "tokenizer*"]
+# Concurrent file downloads shared by all prefetched snapshots
+_SNAPSHOT_DOWNLOAD_WORKERS = 8
+_EXPANDABLE_SEGMENTS = "expandable_segments:True"
+# Report field -> torch.cuda.memory_stats() key
+_CUDA_MEMORY_STAT_KEYS = (
+    ("allocated", "allocated_bytes.all.current"),
+    ("reserved", "reserved_bytes.all.current"),
+    ("max_allocated", "allocated_bytes.all.peak"),
+)
+# _ModelState sequence field -> event type logged for an out-of-range index
+_INDEX_ERROR_EVENTS = {
+    "scaffold_models": "scaffold_model_index_error",
+    "scaffold_tokenizers": "scaffold_tokenizer_index_error",
+    "scaffold_unk_ids": "scaffold_unk_id_index_error",
+}
+# A cache flush runs a full gc collection at least this often; other flushes only collect generation 0
+_FULL_GC_INTERVAL = 8
+# empty_cache only runs when reserved memory exceeds this share of the device or this multiple of allocated memory
+_CACHE_RESERVED_CAPACITY_RATIO = 0.8
+_CACHE_RESERVED_ALLOCATED_RATIO = 2.0
+# The warm inference workspace takes at most this share of the memory still available to the process
+_WORKSPACE_HEADROOM_SHARE = 0.5
+# QuantizedCache backend per KV cache bit width
+_KV_QUANT_BACKENDS = {4: "quanto", 8: "HQQ"}
+
+# Model config attributes that may hold the context window, in order of preference
+_CTX_ATTRS = ("max_position_embeddings", "n_ctx", "seq_length", "max_seq_len")
+# Failed recovery attempts are not retried for this many seconds; at most this many are tracked
+_FAILED_RECOVERY_COOLDOWN = 5.0
+_FAILED_RECOVERY_MAX_ENTRIES = 32
+# Linear layers swapped to bnb layers when quantizing a loaded model in place
+_QUANTIZABLE_PROJECTIONS = frozenset({"q_proj", "k_proj", "v_proj", "o_proj", "gate_proj", "up_proj", "down_proj"})
+
 # Decorator function (defined outside the class for clarity)
 def _prevent_immediate_retry(recovery_func):
     @wraps(recovery_func)
@@ -34,8 +81,8 @@ def _prevent_immediate_retry(recovery_func):
 
         recovery_key = (record.hash, strategy_name)
 
-        # Skip if this exact recovery just failed
-        if self._last_failed_recovery_key == recovery_key:
+        # Skip if this exact recovery failed recently
+        if time.monotonic() < self._failed_recoveries.get(recovery_key, 0.0):
             self._log_event(
                 f"{strategy_name}_skipped",
                 f"Skipping immediate retry of failed {strategy_name} recovery",
@@ -47,31 +94,62 @@ def _prevent_immediate_retry(recovery_func):
         try:
             # Call the original recovery function
             result = recovery_func(self, record, *args, **kwargs)
-            # Reset the flag ONLY if the recovery function completed without raising an exception.
+            # Clear the entry ONLY if the recovery function completed without raising an exception.
             # NOTE: This signifies the recovery *attempt* finished, not necessarily that the
             # underlying root cause of the error has been resolved. The error might recur.
-            self._last_failed_recovery_key = None
+            self._failed_recoveries.pop(recovery_key, None)
             return result
         except Exception as e:
-            # Mark this recovery attempt as failed
-            self._last_failed_recovery_key = recovery_key
+            # Mark this recovery attempt as failed for a short cooldown, evicting the oldest entries
+            self._failed_recoveries[recovery_key] = time.monotonic() + _FAILED_RECOVERY_COOLDOWN
+            self._failed_recoveries.move_to_end(recovery_key)
+            while len(self._failed_recoveries) > _FAILED_RECOVERY_MAX_ENTRIES:
+                self._failed_recoveries.popitem(last=False)
             # Log the failure during the recovery attempt
             self._log_error(
                 f"Exception during recovery attempt in {strategy_name}: {str(e)}",
                 error_type="recovery_attempt_error",
-                stack_trace=traceback.format_exc(),
+                exc_info=True,
                 additional_info={"error_hash": record.hash}
             )
             # Re-raise the exception so the main error handling flow continues
             raise e
+        finally:
+            # Release whatever the recovery freed in one pass
+            self._flush_cache()
     return wrapper
 
+# Immutable snapshot of the loaded models; rebound as a whole so readers never need the memory lock
+_ModelState = namedtuple("_ModelState", ["base_model", "scaffold_models", "base_tokenizer", "scaffold_tokenizers", "scaffold_unk_ids"])
+_EMPTY_MODEL_STATE = _ModelState(None, (), None, (), ())
+
+def _state_property(name: str, doc: str) -> property:
+    """Expose a _ModelState field as an attribute; assignment publishes a new snapshot."""
+    def fget(self):
+        return getattr(self._model_state, name)
+
+    def fset(self, value):
+        if isinstance(value, list):
+            value = tuple(value)
+        with self._memory_lock:
+            self._model_state = self._model_state._replace(**{name: value})
+
+    return property(fget, fset, doc=doc)
+
 class ModelManager:
     """
     A module for managing model loading, initialization, and switching in the SOVL system.
     Handles base model, scaffold models, tokenizers, and related configurations.
     Integrates ResourceManager for coordinated GPU memory management.
     """
+    _quant_configs: Dict[str, Optional[BitsAndBytesConfig]] = {}  # Shared per-mode quantization configs
+
+    base_model = _state_property("base_model", "The loaded base model, if any.")
+    scaffold_models = _state_property("scaffold_models", "Tuple of loaded scaffold models.")
+    base_tokenizer = _state_property("base_tokenizer", "The base model tokenizer, if loaded.")
+    scaffold_tokenizers = _state_property("scaffold_tokenizers", "Tuple of scaffold tokenizers.")
+    scaffold_unk_ids = _state_property("scaffold_unk_ids", "Tuple of scaffold UNK token IDs.")
+
     def __init__(self, config_manager: ConfigManager, logger: Logger, device: torch.device, resource_manager: ResourceManager = None):
         """
         Initialize the ModelManager.
@@ -84,9 +162,16 @@ class ModelManager:
         self._config_manager = config_manager
         self._logger = logger
         self._device = device
-        self._memory_lock = Lock()
+        self._cuda_available: bool = torch.cuda.is_available()  # Fixed for the process lifetime
+        self._memory_lock = RLock()  # Reentrant: cleanup/reload paths nest through load_models
         self._gpu_lock = Lock()  # Add dedicated GPU lock
-        self._last_failed_recovery_key = None  # Track last failed recovery attempt
+        self._failed_recoveries: OrderedDict = OrderedDict()  # (error hash, strategy) -> cooldown expiry
+        self._loaded_fingerprint = None  # Fingerprint of the configuration currently loaded, if any
+        self._cache_dirty = False  # Set when freed memory is waiting for a deferred cache flush
+        self._flushes_since_full_gc = 0  # Cache flushes since the last full gc collection
+        self._workspace_bytes = 0  # Reserved on purpose by _warm_inference_workspace; not counted as bloat
+        self._size_cache: Dict[str, int] = {}  # model_name -> estimated parameter count
+        self._max_context_length_cache: Optional[int] = None  # Resolved once per load of the base model
         self.components = {}  # For compatibility with other modules
         # ResourceManager integration
         if resource_manager is None:
@@ -98,15 +183,22 @@ class ModelManager:
         self._initialize_error_manager()
         # Initialize configuration
         self._initialize_config()
+        # Allocator settings must be applied before any CUDA tensor is created
+        self._allocator_settings = self._configure_allocator()
         # Model storage
-        self.base_model = None
-        self.scaffold_models = []  # List to support multiple scaffolds
-        self.base_tokenizer = None
-        self.scaffold_tokenizers = []  # List to support multiple scaffold tokenizers
-        self.scaffold_unk_ids = []  # List to support multiple scaffold UNK IDs
+        self._model_state = _EMPTY_MODEL_STATE  # base/scaffold models and tokenizers, published atomically
+        self._scaffold_sizes_mb = []  # GPU memory acquired per scaffold, parallel to scaffold_models
+        self._base_model_size_mb = 0  # GPU memory acquired for the base model
         self.base_config = None
         self.lora_managers = []
         self.active_lora_checkpoint = None
+        self._lora_bank: Dict[str, Dict[str, torch.Tensor]] = {}  # Preloaded adapter state dicts by name
+        self._snapshot_futures: Dict[str, Future] = {}
+        self._snapshot_executor: Optional[ThreadPoolExecutor] = None
+        if self.prefetch_snapshots:
+            self._prefetch_snapshots()
+        if self._device.type == "cuda" and self._cuda_available:
+            torch.cuda.memory.set_per_process_memory_fraction(self.cuda_memory_fraction, device=self._device)
         # Initialize models and tokenizers
         self.load_models()
 
@@ -182,7 +274,7 @@ class ModelManager:
             self._log_error(
                 f"Exception during model loading recovery attempt (target mode: {self.quantization_mode}): {str(e)}",
                 error_type="model_loading_recovery_exception",
-                stack_trace=traceback.format_exc(),
+                exc_info=True,
                 additional_info={"error_hash": record.hash, "recovery_target_quantization": self.quantization_mode}
             )
             raise
@@ -229,17 +321,16 @@ class ModelManager:
                     self._log_error(
                         f"Failed to change quantization to {new_mode} during memory recovery: {str(e_quant)}",
                         error_type="memory_recovery_quant_fail",
-                        stack_trace=traceback.format_exc(),
+                        exc_info=True,
                         additional_info={"error_hash": record.hash, "target_mode": new_mode}
                     )
 
             # Clear CUDA cache AFTER attempting quantization change
             cache_cleared = False
-            if torch.cuda.is_available():
+            if self._cuda_available:
                 self._log_event("memory_allocation_recovery_attempt", "Clearing CUDA cache.", level="info", additional_info={"error_hash": record.hash})
-                with self._gpu_lock:
-                    torch.cuda.empty_cache()
-                cache_cleared = True
+                self._cache_dirty = True
+                cache_cleared = self._flush_cache(force=True)
                 self._log_event("memory_allocation_recovery_step", "Cleared CUDA cache.", level="info", additional_info={"error_hash": record.hash})
 
             # Final log summarizing actions taken
@@ -262,7 +353,7 @@ class ModelManager:
             self._log_error(
                 f"Unexpected exception during _recover_memory_allocation: {str(e)}",
                 error_type="recovery_internal_error",
-                stack_trace=traceback.format_exc(),
+                exc_info=True,
                 additional_info={"error_hash": record.hash}
             )
             raise
@@ -306,7 +397,7 @@ class ModelManager:
             self._log_error(
                 f"Exception during quantization recovery attempt (target mode: {new_mode}): {str(e)}",
                 error_type="quantization_recovery_exception",
-                stack_trace=traceback.format_exc(),
+                exc_info=True,
                 additional_info={"error_hash": record.hash, "recovery_target_quantization": new_mode}
             )
             raise
@@ -344,27 +435,71 @@ class ModelManager:
             self._log_error(
                 f"Exception during tokenizer recovery attempt: {str(e)}",
                 error_type="tokenizer_recovery_exception",
-                stack_trace=traceback.format_exc(),
+                exc_info=True,
                 additional_info={"error_hash": record.hash}
             )
             raise
 
     def _estimate_model_size(self, model_name: str) -> int:
-        """Estimate model size in MB for resource acquisition."""
-        try:
-            config = AutoConfig.from_pretrained(model_name)
-            dummy_model = AutoModelForCausalLM.from_config(config)
-            param_count = sum(p.numel() for p in dummy_model.parameters())
-            # Assume fp16 (2 bytes per param) unless quantization is known
-            size_bytes = param_count * 2
-            return size_bytes // (1024 * 1024)
-        except Exception as e:
-            self._log_error(
-                f"Failed to estimate model size for {model_name}: {str(e)}",
-                error_type="model_size_estimation_error",
-                stack_trace=traceback.format_exc()
-            )
-            return 2048  # Default to 2GB if estimation fails
+        """Estimate model size in MB for resource acquisition.
+        Parameter counts are memoized per model name; the byte size follows the current quantization mode.
+        """
+        param_count = self._size_cache.get(model_name)
+        if param_count is None:
+            try:
+                try:
+                    param_count = self._safetensors_param_count(model_name)
+                except Exception:
+                    # No readable safetensors headers; fall back to the config-based estimate
+                    param_count = self._analytic_param_count(model_name)
+            except Exception as e:
+                self._log_error(
+                    f"Failed to estimate model size for {model_name}: {str(e)}",
+                    error_type="model_size_estimation_error",
+                    exc_info=True
+                )
+                return 2048  # Default to 2GB if estimation fails
+            self._size_cache[model_name] = param_count
+        bytes_per_param = _BYTES_PER_PARAM.get(self.quantization_mode, 2.0)
+        return int(param_count * bytes_per_param) // (1024 * 1024)
+
+    @staticmethod
+    def _safetensors_param_count(model_name: str) -> int:
+        """Count parameters from safetensors headers only (a few KB read), local directory or Hub repo."""
+        if os.path.isdir(model_name):
+            shards = [f for f in os.listdir(model_name) if f.endswith(".safetensors")]
+            if not shards:
+                raise FileNotFoundError(f"No safetensors shards in {model_name}")
+            param_count = 0
+            for shard in shards:
+                with safe_open(os.path.join(model_name, shard), framework="pt") as f:
+                    for key in f.keys():
+                        shape = f.get_slice(key).get_shape()
+                        numel = 1
+                        for dim in shape:
+                            numel *= dim
+                        param_count += numel
+            return param_count
+        metadata = get_safetensors_metadata(model_name)
+        return sum(metadata.parameter_count.values())
+
+    @staticmethod
+    def _analytic_param_count(model_name: str) -> int:
+        """Analytically estimate the parameter count from the model config, without instantiating weights."""
+        config = AutoConfig.from_pretrained(model_name)
+        hidden = getattr(config, "hidden_size", None) or getattr(config, "n_embd", None) or getattr(config, "d_model")
+        n_layers = getattr(config, "num_hidden_layers", None) or getattr(config, "n_layer", None) or getattr(config, "num_layers")
+        vocab = getattr(config, "vocab_size", 0)
+        intermediate = getattr(config, "intermediate_size", None)
+        if intermediate:
+            # LLaMA-style: q/k/v/o projections plus gated MLP (gate, up, down)
+            per_layer = 4 * hidden * hidden + 3 * hidden * intermediate
+        else:
+            per_layer = 12 * hidden * hidden
+        embeddings = vocab * hidden
+        if not getattr(config, "tie_word_embeddings", True):
+            embeddings *= 2
+        return n_layers * per_layer + embeddings
 
     def load_models(self, lora_checkpoint_path: str = None):
         """Load base and scaffold models along with their tokenizers.
@@ -372,42 +507,53 @@ class ModelManager:
         Acquires GPU memory via ResourceManager before loading models.
         """
         try:
+            # The memory lock only guards state mutation; the long from_pretrained calls run outside it
+            self._clear_scaffold_resources()
+            self._load_tokenizers()
+            self._reserve_cuda_pool()
+            self._await_snapshots()
+            # Estimate and acquire GPU memory for base model
+            model_size_mb = self._estimate_model_size(self.base_model_name)
+            if not self.resource_manager.acquire("gpu_memory", amount=model_size_mb):
+                raise RuntimeError("Insufficient GPU memory for base model")
+            try:
+                self._load_base_model()
+            except Exception as e:
+                self.resource_manager.release("gpu_memory", amount=model_size_mb)
+                raise
             with self._memory_lock:
-                self._clear_scaffold_resources()
-                self._load_tokenizers()
-                # Estimate and acquire GPU memory for base model
-                model_size_mb = self._estimate_model_size(self.base_model_name)
-                if not self.resource_manager.acquire("gpu_memory", amount=model_size_mb):
-                    raise RuntimeError("Insufficient GPU memory for base model")
+                self._base_model_size_mb = model_size_mb
+                self.scaffold_models = []
+                self._scaffold_sizes_mb = []
+                self.lora_managers = []
+            for model_name in self.scaffold_model_names:
+                scaffold_size_mb = self._estimate_model_size(model_name)
+                if not self.resource_manager.acquire("gpu_memory", amount=scaffold_size_mb):
+                    raise RuntimeError(f"Insufficient GPU memory for scaffold model {model_name}")
                 try:
-                    self._load_base_model()
+                    scaffold_model, lora_manager = self._load_scaffold_model(model_name, lora_checkpoint_path)
                 except Exception as e:
-                    self.resource_manager.release("gpu_memory", amount=model_size_mb)
+                    self.resource_manager.release("gpu_memory", amount=scaffold_size_mb)
                     raise
-                self.scaffold_models = []
-                self.lora_managers = []
-                for model_name in self.scaffold_model_names:
-                    scaffold_size_mb = self._estimate_model_size(model_name)
-                    if not self.resource_manager.acquire("gpu_memory", amount=scaffold_size_mb):
-                        raise RuntimeError(f"Insufficient GPU memory for scaffold model {model_name}")
-                    try:
-                        scaffold_model, lora_manager = self._load_scaffold_model(model_name, lora_checkpoint_path)
-                        self.scaffold_models.append(scaffold_model)
-                        self.lora_managers.append(lora_manager)
-                    except Exception as e:
-                        self.resource_manager.release("gpu_memory", amount=scaffold_size_mb)
-                        raise
-                self._log_event(
-                    "model_loading",
-                    "Successfully loaded all models",
-                    level="info",
-                    additional_info={
-                        "base_model": self.base_model_name,
-                        "scaffold_models": self.scaffold_model_names,
-                        "num_scaffolds_loaded": len(self.scaffold_models),
-                        "quantization": self.quantization_mode
-                    }
-                )
+                with self._memory_lock:
+                    self.scaffold_models = (*self.scaffold_models, scaffold_model)
+                    self._scaffold_sizes_mb.append(scaffold_size_mb)
+                    self.lora_managers.append(lora_manager)
+            self._log_event(
+                "model_loading",
+                "Successfully loaded all models",
+                level="info",
+                additional_info={
+                    "base_model": self.base_model_name,
+                    "scaffold_models": self.scaffold_model_names,
+                    "num_scaffolds_loaded": len(self.scaffold_models),
+                    "quantization": self.quantization_mode
+                }
+            )
+            self._loaded_fingerprint = self._model_fingerprint(self.quantization_mode)
+            self._max_context_length_cache = self._resolve_max_context_length(self.base_model)
+            self._flush_cache()
+            self._warm_inference_workspace()
         except Exception as e:
             self.error_manager.handle_error(
                 error=e,
@@ -422,21 +568,210 @@ class ModelManager:
             )
             raise
 
-    def _clear_scaffold_resources(self):
-        """Clear scaffold models and tokenizers, and release GPU memory via ResourceManager."""
+    def _configure_allocator(self) -> Optional[str]:
+        """
+        Opt the CUDA caching allocator into expandable segments so freed blocks coalesce across reloads.
+        Returns the allocator setting that is in effect, if any.
+        """
+        if not self.use_expandable_segments:
+            return os.environ.get("PYTORCH_CUDA_ALLOC_CONF")
+        setter = getattr(torch.cuda.memory, "_set_allocator_settings", None)
+        if setter is not None and self._cuda_available:
+            try:
+                setter(_EXPANDABLE_SEGMENTS)
+                return _EXPANDABLE_SEGMENTS
+            except RuntimeError as e:
+                self._log_event(
+                    "allocator_config_fallback",
+                    f"Could not set allocator settings at runtime, using PYTORCH_CUDA_ALLOC_CONF: {str(e)}",
+                    level="warning"
+                )
+        # Environment fallback only takes effect if the allocator has not initialized yet
+        return os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", _EXPANDABLE_SEGMENTS)
+
+    def _prefetch_snapshots(self) -> None:
+        """Start parallel Hub downloads of all model shards so network I/O overlaps tokenizer and CUDA setup."""
+        names = [name for name in dict.fromkeys([self.base_model_name, *self.scaffold_model_names]) if not os.path.isdir(name)]
+        if not names:
+            return
+        # Split one download budget across models rather than opening a full pool per model
+        workers_per_model = max(1, _SNAPSHOT_DOWNLOAD_WORKERS // len(names))
+        self._snapshot_executor = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="snapshot_prefetch")
+        for name in names:
+            self._snapshot_futures[name] = self._snapshot_executor.submit(
+                snapshot_download, name, max_workers=workers_per_model, allow_patterns=_SNAPSHOT_PATTERNS
+            )
+
+    def _await_snapshots(self) -> None:
+        """Block until every prefetch has finished; failures are reported when the model path is resolved."""
+        if self._snapshot_futures:
+            wait(self._snapshot_futures.values())
+
+    def _resolve_model_path(self, model_name: str) -> str:
+        """Return the prefetched local snapshot for model_name, or model_name itself if unavailable."""
+        future = self._snapshot_futures.get(model_name)
+        if future is None:
+            return model_name
+        try:
+            local_dir = future.result()
+        except Exception as e:
+            self._log_event(
+                "snapshot_prefetch_failed",
+                f"Prefetch of {model_name} failed, loading by name: {str(e)}",
+                level="warning",
+                additional_info={"model_name": model_name}
+            )
+            return model_name
+        # Checkpoints without safetensors weights were not fetched; let from_pretrained resolve them
+        if not any(f.endswith(".safetensors") for f in os.listdir(local_dir)):
+            return model_name
+        return local_dir
+
+    def _reserve_cuda_pool(self) -> None:
+        """
+        Grow the CUDA caching allocator to the expected size of all models with one warm-up allocation,
+        so subsequent loads carve out of a contiguous reserved block instead of many small cudaMallocs.
+        """
+        if self._device.type != "cuda" or not self._cuda_available:
+            return
+        total_mb = sum(self._estimate_model_size(name) for name in [self.base_model_name, *self.scaffold_model_names])
+        try:
+            with self._gpu_lock:
+                scratch = torch.empty(total_mb * 1024 * 1024 // 2, dtype=torch.float16, device=self._device)
+                del scratch  # Freed blocks stay reserved by the caching allocator
+            self._log_event(
+                "cuda_pool_reserved",
+                f"Reserved {total_mb} MB in the CUDA caching allocator",
+                level="debug",
+                additional_info={"reserved_mb": total_mb}
+            )
+        except RuntimeError as e:
+            # Not fatal: models load without the warm pool, just with more fragmentation risk
+            self._log_event(
+                "cuda_pool_reserve_skipped",
+                f"Could not pre-reserve {total_mb} MB CUDA pool: {str(e)}",
+                level="warning",
+                additional_info={"requested_mb": total_mb}
+            )
+
+    def _warm_inference_workspace(self) -> None:
+        """
+        Grow the caching allocator by up to one full-context KV cache for the base model after loading,
+        so the first generation request reuses a warm segment instead of paying allocator growth.
+        The size is capped by the device memory still available under cuda_memory_fraction.
+        """
+        self._workspace_bytes = 0
+        if self._device.type != "cuda" or not self._cuda_available or self.base_model is None:
+            return
+        model_config = getattr(self.base_model, "config", None)
+        hidden_size = getattr(model_config, "hidden_size", None)
+        num_layers = getattr(model_config, "num_hidden_layers", None)
+        if not hidden_size or not num_layers:
+            return
+        dtype = getattr(self.base_model, "dtype", torch.float16)
+        if not dtype.is_floating_point:
+            dtype = torch.float16  # Quantized weights still produce half-precision activations
+        element_size = torch.finfo(dtype).bits // 8
+        # Keys and values for every layer over one full-length sequence
+        numel = 2 * num_layers * self.get_max_context_length() * hidden_size
+        # Long-context models would ask for far more than fits; cap at a share of what this process may
+        # still claim, since an OOM here makes the allocator drop the pool _reserve_cuda_pool reserved
+        free_bytes, total_bytes = torch.cuda.mem_get_info(self._device)
+        headroom_bytes = min(
+            free_bytes,
+            int(self.cuda_memory_fraction * total_bytes) - torch.cuda.memory_reserved(self._device)
+        )
+        numel = min(numel, int(headroom_bytes * _WORKSPACE_HEADROOM_SHARE) // element_size)
+        if numel <= 0:
+            self._log_event(
+                "inference_workspace_skipped",
+                "No memory headroom for an inference workspace",
+                level="debug",
+                additional_info={"headroom_bytes": headroom_bytes}
+            )
+            return
+        workspace_mb = numel * element_size // (1024 * 1024)
+        try:
+            with self._gpu_lock:
+                workspace = torch.empty(numel, dtype=dtype, device=self._device)
+                del workspace  # Freed blocks stay reserved by the caching allocator
+                self._workspace_bytes = numel * element_size
+            self._log_event(
+                "inference_workspace_reserved",
+                f"Pre-allocated {workspace_mb} MB inference workspace",
+                level="debug",
+                additional_info={"workspace_mb": workspace_mb}
+            )
+        except RuntimeError as e:
+            # Not fatal: the first request simply grows the pool itself
+            self._log_event(
+                "inference_workspace_skipped",
+                f"Could not pre-allocate {workspace_mb} MB inference workspace: {str(e)}",
+                level="warning",
+                additional_info={"requested_mb": workspace_mb}
+            )
+
+    def _flush_cache(self, force: bool = False) -> bool:
+        """
+        Run the deferred gc + CUDA cache release once if anything was freed since the last flush.
+        Cleanup paths only mark the cache dirty so a burst of releases costs a single device sync.
+        empty_cache itself only runs when forced or when the caching allocator is holding excess memory.
+        """
+        with self._gpu_lock:
+            if not self._cache_dirty:
+                return False
+            self._cache_dirty = False
+            self._flushes_since_full_gc += 1
+            # Dropped models are freed by refcount, so only leaked cycles need a full collection; do one periodically
+            if force or self._flushes_since_full_gc >= _FULL_GC_INTERVAL or gc.get_count()[2] >= gc.get_threshold()[2]:
+                gc.collect()
+                self._flushes_since_full_gc = 0
+            else:
+                gc.collect(0)
+            if self._cuda_available and (force or self._cuda_cache_bloated()):
+                torch.cuda.empty_cache()
+                torch.cuda.ipc_collect()
+        return True
+
+    def _cuda_cache_bloated(self) -> bool:
+        """
+        True if reserved memory on self._device is near its capacity or well above what is actually allocated.
+        The warmed inference workspace is idle by design, so it is left out of the allocated-ratio check.
+        """
+        if self._device.type != "cuda":
+            return False
+        reserved = torch.cuda.memory_reserved(self._device)
+        allocated = torch.cuda.memory_allocated(self._device)
+        total = torch.cuda.get_device_properties(self._device).total_memory
+        idle_reserved = reserved - self._workspace_bytes
+        return reserved > _CACHE_RESERVED_CAPACITY_RATIO * total or idle_reserved > _CACHE_RESERVED_ALLOCATED_RATIO * max(allocated, 1)
+
+    def _clear_scaffold_resources(self, release_memory: bool = True) -> int:
+        """
+        Clear scaffold models and tokenizers, and release GPU memory via ResourceManager.
+        Args:
+            release_memory: If False, the caller releases the returned amount itself (batched with other releases).
+        Returns:
+            GPU memory in MB that was held by the cleared scaffolds.
+        """
         with self._memory_lock:
+            scaffold_mb = sum(self._scaffold_sizes_mb)
             if self.scaffold_models:
-                for model, model_name in zip(self.scaffold_models, self.scaffold_model_names):
-                    scaffold_size_mb = self._estimate_model_size(model_name)
-                    self.resource_manager.release("gpu_memory", amount=scaffold_size_mb)
-                    del model
+                # Sizes were recorded at acquisition, so release is a single O(1) call
+                if release_memory:
+                    self.resource_manager.release("gpu_memory", amount=scaffold_mb)
+                # Publish the empty snapshot before dropping our references. Readers that already hold the
+                # old snapshot keep intact weights; the storage is freed once the last of them lets go
+                released = self.scaffold_models
                 self.scaffold_models = []
+                self._scaffold_sizes_mb = []
+                del released
+            self.lora_managers = []
             self.scaffold_tokenizers = []
             self.scaffold_unk_ids = []
-            if torch.cuda.is_available():
-                with self._gpu_lock:
-                    torch.cuda.empty_cache()
+            self._cache_dirty = True
             self._log_event("scaffold_cleanup", "Cleared scaffold model/tokenizer resources", level="debug")
+            return scaffold_mb
 
     def _load_scaffold_model(self, model_name: str, lora_checkpoint_path: str = None):
         """
@@ -445,7 +780,22 @@ class ModelManager:
         """
         try:
             from sovl_scaffold import create_scaffold_with_adaptation
-            scaffold_model, lora_manager, method_used = create_scaffold_with_adaptation(self._config_manager, self._logger, self._error_manager, lora_checkpoint_path)
+            # LoRA weights are loaded here rather than by the factory so the copy goes through pinned memory
+            scaffold_model, lora_manager, method_used = create_scaffold_with_adaptation(self._config_manager, self._logger, self._error_manager)
+            if lora_checkpoint_path and method_used == "lora":
+                try:
+                    set_peft_model_state_dict(scaffold_model, self._load_lora_state_dict(lora_checkpoint_path))
+                except Exception as e:
+                    self._log_event(
+                        "lora_load_warning",
+                        f"Failed to load LoRA checkpoint {lora_checkpoint_path}: {str(e)}",
+                        level="warning",
+                        additional_info={"model_name": model_name, "path": lora_checkpoint_path}
+                    )
+            if self.alora_enabled and method_used == "lora":
+                self._enable_alora(scaffold_model)
+            if self.kv_quant_bits is not None:
+                self.enable_kv_quant(scaffold_model, bits=self.kv_quant_bits)
             self._log_event(
                 "scaffold_adaptation",
                 f"Scaffold model loaded with adaptation method: {method_used}",
@@ -457,11 +807,123 @@ class ModelManager:
             self._log_error(
                 f"Failed to load scaffold model {model_name}: {str(e)}",
                 error_type="scaffold_model_loading_error",
-                stack_trace=traceback.format_exc(),
+                exc_info=True,
                 additional_info={"model_name": model_name}
             )
             raise
 
+    def _enable_alora(self, scaffold_model: nn.Module) -> int:
+        """
+        Switch a PEFT-wrapped scaffold to Activated-LoRA: adapter deltas only apply to tokens at or after
+        the invocation position, so prefix keys/values match the un-adapted model and its KV cache can be reused.
+        Returns the number of LoRA layers patched.
+        """
+        patched = 0
+        for module in scaffold_model.modules():
+            if hasattr(module, "lora_A") and hasattr(module, "base_layer"):
+                module.forward = self._make_alora_forward(module)
+                patched += 1
+        scaffold_model.register_forward_pre_hook(self._record_alora_invocation, with_kwargs=True)
+        scaffold_model.register_forward_hook(self._clear_alora_invocation, always_call=True)
+        self._log_event(
+            "alora_enabled",
+            f"Activated-LoRA gating applied to {patched} layers",
+            level="info",
+            additional_info={"patched_layers": patched, "invocation_token_id": self._alora_invocation_token_id}
+        )
+        return patched
+
+    def _make_alora_forward(self, module: nn.Module):
+        """Build a LoRA layer forward that masks the adapter delta for positions before each row's invocation index."""
+        lora_forward = module.forward
+
+        def forward(x, *args, **kwargs):
+            t_invoke = getattr(self._alora_calls, "t_invoke", None)
+            # Incremental decoding steps, batches we did not index, and LoRA variants we do not
+            # reimplement (DoRA, mixed-batch adapter_names) take the regular LoRA path
+            if (
+                t_invoke is None
+                or x.dim() < 3
+                or x.shape[-2] == 1
+                or x.shape[0] != t_invoke.shape[0]
+                or not self._alora_supported(module, kwargs)
+            ):
+                return lora_forward(x, *args, **kwargs)
+            result = module.base_layer(x, *args, **kwargs)
+            if module.disable_adapters:
+                return result
+            positions = torch.arange(x.shape[-2], device=x.device)
+            keep = (positions.unsqueeze(0) >= t_invoke.to(x.device).unsqueeze(-1)).unsqueeze(-1)  # [B, T, 1]
+            for adapter in module.active_adapters:
+                if adapter not in module.lora_A:
+                    continue
+                lora_A = module.lora_A[adapter]
+                h = module.lora_dropout[adapter](x.to(lora_A.weight.dtype))
+                delta = module.lora_B[adapter](lora_A(h)) * module.scaling[adapter]
+                result = result + delta.to(result.dtype) * keep
+            return result
+
+        return forward
+
+    @staticmethod
+    def _alora_supported(module: nn.Module, kwargs: dict) -> bool:
+        """Whether the gated forward reproduces this LoRA layer; otherwise PEFT's own forward is used."""
+        if kwargs.get("adapter_names") is not None:
+            return False
+        use_dora = getattr(module, "use_dora", {})
+        magnitudes = getattr(module, "lora_magnitude_vector", {})
+        return not any(use_dora.get(adapter, False) or adapter in magnitudes for adapter in module.active_adapters)
+
+    def _record_alora_invocation(self, module: nn.Module, args: tuple, kwargs: dict):
+        """
+        Forward pre-hook: record, per row, the first occurrence of the invocation token in a prefill pass.
+        Indices live in thread-local state for the duration of this call, so concurrent calls and other
+        scaffolds never see them. Rows without the token get index 0 and are fully adapted.
+        """
+        input_ids = kwargs.get("input_ids", args[0] if args else None)
+        if self._alora_invocation_token_id is None or not torch.is_tensor(input_ids) or input_ids.shape[-1] == 1:
+            self._alora_calls.t_invoke = None
+            return None
+        matches = input_ids.reshape(-1, input_ids.shape[-1]) == self._alora_invocation_token_id
+        first = matches.int().argmax(dim=-1)
+        self._alora_calls.t_invoke = torch.where(matches.any(dim=-1), first, torch.zeros_like(first))
+        return None
+
+    def _clear_alora_invocation(self, module: nn.Module, args: tuple, output: Any):
+        """Forward hook: drop this call's invocation indices."""
+        self._alora_calls.t_invoke = None
+        return None
+
+    def set_invocation_token(self, token_id: Optional[int]) -> None:
+        """Set the token whose first occurrence marks where aLoRA scaffolds start adapting."""
+        self._alora_invocation_token_id = token_id
+
+    def enable_kv_quant(self, model: nn.Module, bits: int = 8) -> bool:
+        """
+        Make generate() on the model store its KV cache quantized to the given bit width.
+        Uses the transformers QuantizedCache: quanto for 4-bit, HQQ for 8-bit. Returns False if unsupported.
+        """
+        if bits not in _KV_QUANT_BACKENDS:
+            raise ValueError(f"Unsupported KV cache bit width {bits}; expected one of {sorted(_KV_QUANT_BACKENDS)}")
+        generation_config = getattr(model, "generation_config", None)
+        if generation_config is None:
+            self._log_event(
+                "kv_quant_skipped",
+                "Model has no generation_config; KV cache quantization not applied",
+                level="warning",
+                additional_info={"bits": bits}
+            )
+            return False
+        generation_config.cache_implementation = "quantized"
+        generation_config.cache_config = {"backend": _KV_QUANT_BACKENDS[bits], "nbits": bits}
+        self._log_event(
+            "kv_quant_enabled",
+            f"KV cache quantization enabled at {bits} bits",
+            level="info",
+            additional_info={"bits": bits, "backend": _KV_QUANT_BACKENDS[bits]}
+        )
+        return True
+
     def _load_base_model(self):
         """
         Load the base model and apply LoRA if enabled.
@@ -486,7 +948,11 @@ class ModelManager:
                     message=f"LoRA not enabled for base model",
                     level="info"
                 )
-            self.base_model = base_model
+            with self._memory_lock:
+                self.base_model = base_model
+            # Drop the local handle so the pre-LoRA module can be collected
+            del base_model
+            self._cache_dirty = True
             
             self._log_event(
                 "base_model_loading",
@@ -501,119 +967,108 @@ class ModelManager:
             self._log_error(
                 f"Failed to load base model: {str(e)}",
                 error_type="base_model_loading_error",
-                stack_trace=traceback.format_exc()
+                exc_info=True
             )
             raise
 
+    @classmethod
+    def _build_quant_config(cls, mode: str) -> Optional[BitsAndBytesConfig]:
+        """Return the shared BitsAndBytesConfig for a quantization mode (None for fp16)."""
+        if mode not in cls._quant_configs:
+            if mode == "int4":
+                cls._quant_configs[mode] = BitsAndBytesConfig(
+                    load_in_4bit=True,
+                    bnb_4bit_compute_dtype=torch.float16,
+                    bnb_4bit_use_double_quant=True,
+                    bnb_4bit_quant_type="nf4",
+                    bnb_4bit_quant_storage=torch.uint8
+                )
+            elif mode == "int8":
+                cls._quant_configs[mode] = BitsAndBytesConfig(load_in_8bit=True)
+            else:  # fp16
+                cls._quant_configs[mode] = None
+        return cls._quant_configs[mode]
+
+    def _from_pretrained(self, model_name: str) -> nn.Module:
+        """
+        Load a causal LM with the current quantization mode.
+        Weights stream straight onto self._device; device_map="auto" is only used if the model does not fit there.
+        """
+        kwargs = {
+            "torch_dtype": torch.float16,
+            "low_cpu_mem_usage": True,
+            "quantization_config": self._build_quant_config(self.quantization_mode)
+        }
+        model_path = self._resolve_model_path(model_name)
+        with self._gpu_lock:
+            try:
+                return AutoModelForCausalLM.from_pretrained(model_path, device_map={"": self._device}, **kwargs)
+            except (torch.cuda.OutOfMemoryError, ValueError) as e:
+                self._log_event(
+                    "single_device_load_fallback",
+                    f"Could not place {model_name} on {self._device}, falling back to device_map='auto': {str(e)}",
+                    level="warning",
+                    additional_info={"model_name": model_name}
+                )
+                if self._cuda_available:
+                    torch.cuda.empty_cache()
+                return AutoModelForCausalLM.from_pretrained(model_path, device_map="auto", **kwargs)
+
     def _load_raw_scaffold_model(self, model_name: str):
         """Load a single scaffold model with appropriate quantization."""
         try:
-            with self._memory_lock:
-                # Load the scaffold model with appropriate quantization
-                if self.quantization_mode == "int4":
-                    with self._gpu_lock:
-                        model = AutoModelForCausalLM.from_pretrained(
-                            model_name,
-                            load_in_4bit=True,
-                            device_map="auto",
-                            torch_dtype=torch.float16,
-                            quantization_config=bnb.nn.QuantizeConfig(
-                                load_in_4bit=True,
-                                bnb_4bit_compute_dtype=torch.float16,
-                                bnb_4bit_use_double_quant=True,
-                                bnb_4bit_quant_type="nf4"
-                            )
-                        )
-                elif self.quantization_mode == "int8":
-                    with self._gpu_lock:
-                        model = AutoModelForCausalLM.from_pretrained(
-                            model_name,
-                            load_in_8bit=True,
-                            device_map="auto",
-                            torch_dtype=torch.float16
-                        )
-                else:  # fp16
-                    with self._gpu_lock:
-                        model = AutoModelForCausalLM.from_pretrained(
-                            model_name,
-                            torch_dtype=torch.float16,
-                            device_map="auto"
-                        )
-                
-                model.eval()
-                return model
+            model = self._from_pretrained(model_name)
+            model.eval()
+            return model
         except Exception as e:
             self._log_error(
                 f"Failed to load raw scaffold model {model_name}: {str(e)}",
                 error_type="scaffold_model_loading_error",
-                stack_trace=traceback.format_exc(),
+                exc_info=True,
                 additional_info={"model_name": model_name}
             )
             raise
 
     def _load_raw_base_model(self):
-        """Load the base model with appropriate quantization."""
+        """Load and return the base model with appropriate quantization. Does not touch self.base_model."""
         try:
-            with self._memory_lock:
-                if self.quantization_mode == "int4":
-                    with self._gpu_lock:
-                        self.base_model = AutoModelForCausalLM.from_pretrained(
-                            self.base_model_name,
-                            load_in_4bit=True,
-                            device_map="auto",
-                            torch_dtype=torch.float16,
-                            quantization_config=bnb.nn.QuantizeConfig(
-                                load_in_4bit=True,
-                                bnb_4bit_compute_dtype=torch.float16,
-                                bnb_4bit_use_double_quant=True,
-                                bnb_4bit_quant_type="nf4"
-                            )
-                        )
-                elif self.quantization_mode == "int8":
-                    with self._gpu_lock:
-                        self.base_model = AutoModelForCausalLM.from_pretrained(
-                            self.base_model_name,
-                            load_in_8bit=True,
-                            device_map="auto",
-                            torch_dtype=torch.float16
-                        )
-                else:  # fp16
-                    with self._gpu_lock:
-                        self.base_model = AutoModelForCausalLM.from_pretrained(
-                            self.base_model_name,
-                            torch_dtype=torch.float16,
-                            device_map="auto"
-                        )
-                
-                self.base_model.eval()
-                return self.base_model
+            model = self._from_pretrained(self.base_model_name)
+            model.eval()
+            return model
         except Exception as e:
             self._log_error(
                 f"Failed to load raw base model: {str(e)}",
                 error_type="base_model_loading_error",
-                stack_trace=traceback.format_exc()
+                exc_info=True
             )
             raise
 
+    @staticmethod
+    def _load_tokenizer(model_name: str) -> AutoTokenizer:
+        """Load a single left-padded, left-truncated tokenizer."""
+        return AutoTokenizer.from_pretrained(
+            model_name,
+            padding_side="left",
+            truncation_side="left"
+        )
+
     def _load_tokenizers(self):
         """Load tokenizers for both base and scaffold models."""
         try:
+            # Load by name rather than through _resolve_model_path: from_pretrained fetches only the small
+            # tokenizer files, so this overlaps the weight snapshots instead of waiting for them
+            names = [self.base_model_name, *self.scaffold_model_names]
+            # Tokenizer loading is I/O-bound, so threads overlap the per-tokenizer disk reads
+            with ThreadPoolExecutor(max_workers=len(names)) as executor:
+                tokenizers = list(executor.map(self._load_tokenizer, names))
+            base_tokenizer, *scaffold_tokenizers = tokenizers
             with self._memory_lock:
-                self.base_tokenizer = AutoTokenizer.from_pretrained(
-                    self.base_model_name,
-                    padding_side="left",
-                    truncation_side="left"
+                self._model_state = self._model_state._replace(
+                    base_tokenizer=base_tokenizer,
+                    scaffold_tokenizers=tuple(scaffold_tokenizers),
+                    scaffold_unk_ids=tuple(tokenizer.unk_token_id for tokenizer in scaffold_tokenizers)
                 )
                 
-                self.scaffold_tokenizers = [AutoTokenizer.from_pretrained(
-                    name,
-                    padding_side="left",
-                    truncation_side="left"
-                ) for name in self.scaffold_model_names]
-                
-                # Update scaffold_unk_ids after loading tokenizers
-                self.scaffold_unk_ids = [tokenizer.unk_token_id for tokenizer in self.scaffold_tokenizers]
-                
                 self._log_event(
                     "tokenizer_loading",
                     "Successfully loaded tokenizers",
@@ -640,9 +1095,16 @@ class ModelManager:
         try:
             validate_quantization_mode(mode)
             with self._memory_lock:
-                if mode != self.quantization_mode:
+                if self._loaded_fingerprint == self._model_fingerprint(mode):
+                    # Models already resident in this exact configuration; nothing to reload
                     self.quantization_mode = mode
-                    self.reload_models()
+                    return
+                if mode != self.quantization_mode:
+                    if self._can_requantize_loaded(mode):
+                        self._requantize_loaded_models(mode)
+                    else:
+                        self.quantization_mode = mode
+                        self.reload_models()
                     
                     self._log_event(
                         "quantization_change",
@@ -656,7 +1118,7 @@ class ModelManager:
                 f"Model state may be invalid (likely empty) due to reload failure. "
                 f"Original error during reload: {str(e)}",
                 error_type="quantization_change_failed",
-                stack_trace=traceback.format_exc(),
+                exc_info=True,
                 additional_info={
                     "requested_mode": mode,
                     "target_mode": self.quantization_mode
@@ -675,6 +1137,133 @@ class ModelManager:
             )
             raise e
 
+    def _model_fingerprint(self, mode: str) -> int:
+        """Identify a loaded model configuration so redundant reloads can be skipped."""
+        return hash((mode, self.base_model_name, tuple(self.scaffold_model_names), self.active_lora_checkpoint))
+
+    def _can_requantize_loaded(self, target_mode: str) -> bool:
+        """Requantizing loaded models only works downward from resident fp16 weights on CUDA."""
+        return (
+            self.base_model is not None
+            and self.quantization_mode == "fp16"
+            and target_mode in ("int8", "int4")
+            and self._cuda_available
+        )
+
+    def _requantize_loaded_models(self, target_mode: str) -> None:
+        """
+        Quantize the already-loaded base and scaffold models to target_mode without reloading from disk.
+        The quantized models are built alongside the live ones and published as a new snapshot, so readers
+        holding the previous snapshot keep a consistent fp16 model; its weights are freed once they let go.
+        Callers must hold _memory_lock.
+        """
+        loaded_names = [self.base_model_name] + self.scaffold_model_names[:len(self.scaffold_models)]
+        size_before_mb = self._base_model_size_mb + sum(self._scaffold_sizes_mb)
+        state = self._model_state
+        self._model_state = state._replace(
+            base_model=self._requantized_copy(state.base_model, target_mode),
+            scaffold_models=tuple(self._requantized_copy(model, target_mode) for model in state.scaffold_models)
+        )
+        del state
+        self._flush_cache()
+        self.quantization_mode = target_mode
+        self._loaded_fingerprint = self._model_fingerprint(target_mode)
+        self._base_model_size_mb = self._estimate_model_size(self.base_model_name)
+        self._scaffold_sizes_mb = [self._estimate_model_size(name) for name in loaded_names[1:]]
+        freed_mb = size_before_mb - self._base_model_size_mb - sum(self._scaffold_sizes_mb)
+        if freed_mb > 0:
+            self.resource_manager.release("gpu_memory", amount=freed_mb)
+        self._log_event(
+            "quantization_in_place",
+            f"Requantized loaded models to {target_mode}",
+            level="info",
+            additional_info={"models": loaded_names, "freed_mb": freed_mb}
+        )
+
+    def _requantized_copy(self, model: nn.Module, target_mode: str) -> nn.Module:
+        """
+        Return a copy of a resident fp16 model with its standard LLM projections swapped for bnb int8/int4 layers.
+        Only the modules on the path to a swapped projection are shallow-copied; everything else, including the
+        original projections, is shared with model, which is left untouched.
+        """
+        quant_config = self._build_quant_config(target_mode)
+        replacements = {}
+        for name, module in model.named_modules():
+            # Skip LoRA-wrapped linears themselves; their frozen projection is quantized via base_layer
+            if not isinstance(module, nn.Linear) or hasattr(module, "lora_A"):
+                continue
+            parent_name, _, child_name = name.rpartition(".")
+            # PEFT keeps the original projection at "<proj>.base_layer"
+            projection = parent_name.rpartition(".")[2] if child_name == "base_layer" else child_name
+            if projection in _QUANTIZABLE_PROJECTIONS:
+                replacements[name] = self._quantized_linear(module, quant_config)
+
+        copies = {}
+
+        def copied(path: str) -> nn.Module:
+            if path not in copies:
+                original = model.get_submodule(path)
+                clone = copy.copy(original)
+                clone._modules = original._modules.copy()
+                if path:
+                    parent_name, _, child_name = path.rpartition(".")
+                    copied(parent_name)._modules[child_name] = clone
+                copies[path] = clone
+            return copies[path]
+
+        for name, new_layer in replacements.items():
+            parent_name, _, child_name = name.rpartition(".")
+            copied(parent_name)._modules[child_name] = new_layer
+        if not copies:
+            return model
+
+        # Describe the new mode on the copied HF model so save_pretrained/from_pretrained round-trip correctly
+        hf_quantizer = AutoHfQuantizer.from_config(quant_config, pre_quantized=True)
+        for clone in copies.values():
+            config = clone.__dict__.get("config")
+            if not hasattr(config, "to_dict"):
+                continue
+            clone.config = copy.deepcopy(config)
+            clone.config.quantization_config = quant_config
+            clone.hf_quantizer = hf_quantizer
+            clone.quantization_method = quant_config.quant_method
+            clone.is_loaded_in_8bit = target_mode == "int8"
+            clone.is_loaded_in_4bit = target_mode == "int4"
+        self._cache_dirty = True
+        return copies[""]
+
+    def _quantized_linear(self, module: nn.Linear, quant_config: BitsAndBytesConfig) -> nn.Module:
+        """Build a bnb int8/int4 layer on module's device holding a quantized copy of its weights."""
+        device = module.weight.device if module.weight.is_cuda else self._device
+        has_bias = module.bias is not None
+        with self._gpu_lock:
+            # bitsandbytes only quantizes on a CPU -> CUDA transfer, so stage the weight on the host
+            weight = module.weight.data.to("cpu")
+            if quant_config.load_in_8bit:
+                new_layer = bnb.nn.Linear8bitLt(
+                    module.in_features, module.out_features, bias=has_bias, has_fp16_weights=False
+                )
+                new_layer.weight = bnb.nn.Int8Params(
+                    weight, requires_grad=False, has_fp16_weights=False
+                )
+            else:  # int4, matching _build_quant_config so the recorded quantization_config is accurate
+                new_layer = bnb.nn.Linear4bit(
+                    module.in_features, module.out_features, bias=has_bias,
+                    compute_dtype=quant_config.bnb_4bit_compute_dtype,
+                    compress_statistics=quant_config.bnb_4bit_use_double_quant,
+                    quant_type=quant_config.bnb_4bit_quant_type,
+                    quant_storage=quant_config.bnb_4bit_quant_storage
+                )
+                new_layer.weight = bnb.nn.Params4bit(
+                    weight, requires_grad=False,
+                    compress_statistics=quant_config.bnb_4bit_use_double_quant,
+                    quant_type=quant_config.bnb_4bit_quant_type,
+                    quant_storage=quant_config.bnb_4bit_quant_storage
+                )
+            if has_bias:
+                new_layer.bias = nn.Parameter(module.bias.data.to("cpu"), requires_grad=False)
+            return new_layer.to(device)  # Quantization happens here, on the CPU -> CUDA transfer
+
     def reload_models(self):
         """Reload all models with current settings. Ensures rollback and error safety on failure."""
         try:
@@ -683,19 +1272,14 @@ class ModelManager:
                 try:
                     self.load_models()
                 except Exception as load_exc:
-                    # Rollback: ensure all model references are set to None and cleanup is called again
+                    # Rollback: release whatever was partially loaded and drop all model references
                     self._log_event(
                         "reload_rollback",
                         f"load_models failed during reload: {str(load_exc)}. Rolling back to safe state.",
                         level="warning"
                     )
-                    with torch.no_grad():
-                        self.base_model = None
-                        self.scaffold_models = []
-                        self.base_tokenizer = None
-                        self.scaffold_tokenizers = []
-                        self.scaffold_unk_ids = []
                     self.cleanup()
+                    self.base_tokenizer = None
                     raise  # Re-raise the original exception
                 self._log_event(
                     "model_reloading",
@@ -719,44 +1303,60 @@ class ModelManager:
             )
             raise
 
-    def cleanup(self):
-        """Clean up model resources and ensure GPU memory is released."""
+    def shutdown(self):
+        """Final teardown: join snapshot prefetches, release all models and return cached GPU memory if it is bloated."""
+        if self._snapshot_executor is not None:
+            self._snapshot_executor.shutdown(wait=True, cancel_futures=True)
+            self._snapshot_executor = None
+        self.cleanup(final=True)
+
+    def cleanup(self, final: bool = False):
+        """
+        Clean up model resources and release their GPU memory budget.
+        Args:
+            final: Terminal teardown. Only then is the CUDA cache flushed; reloads leave it to the next load.
+        """
         try:
             with self._memory_lock:
-                gpu_mem_before = torch.cuda.memory_allocated() if torch.cuda.is_available() else None
-                self._log_event(
-                    "cleanup_start",
-                    f"Starting cleanup. GPU memory before: {gpu_mem_before}",
-                    level="debug"
-                )
-                with torch.no_grad():
-                    if self.base_model is not None:
-                        model_size_mb = self._estimate_model_size(self.base_model_name)
-                        self.resource_manager.release("gpu_memory", amount=model_size_mb)
-                        del self.base_model
-                        self.base_model = None
-                    for model, model_name in zip(self.scaffold_models, self.scaffold_model_names):
-                        scaffold_size_mb = self._estimate_model_size(model_name)
-                        self.resource_manager.release("gpu_memory", amount=scaffold_size_mb)
-                    self._clear_scaffold_resources()
-                gc.collect()
-                if torch.cuda.is_available():
-                    with self._gpu_lock:
-                        torch.cuda.empty_cache()
-                gpu_mem_after = torch.cuda.memory_allocated() if torch.cuda.is_available() else None
-                self._log_event(
-                    "cleanup_end",
-                    f"Cleanup complete. GPU memory after: {gpu_mem_after}",
-                    level="debug",
-                    additional_info={"gpu_mem_before": gpu_mem_before, "gpu_mem_after": gpu_mem_after}
-                )
-                if gpu_mem_after is not None and gpu_mem_before is not None and gpu_mem_after > 0.5 * gpu_mem_before:
+                # Memory probes are only worth their CUDA runtime calls when debug records are kept
+                probe_memory = self._cuda_available and self._debug_logging_enabled()
+                gpu_mem_before = torch.cuda.memory_allocated() if probe_memory else None
+                if probe_memory:
                     self._log_event(
-                        "cleanup_warning",
-                        f"GPU memory not fully released after cleanup. Before: {gpu_mem_before}, After: {gpu_mem_after}",
-                        level="warning"
+                        "cleanup_start",
+                        f"Starting cleanup. GPU memory before: {gpu_mem_before}",
+                        level="debug"
                     )
-                self.report_gpu_memory_usage()
+                self._loaded_fingerprint = None
+                self._max_context_length_cache = None
+                release_mb = 0
+                if self.base_model is not None:
+                    release_mb = self._base_model_size_mb
+                    self.base_model = None
+                    self._base_model_size_mb = 0
+                # Base and scaffold budgets go back to the ResourceManager in one call
+                release_mb += self._clear_scaffold_resources(release_memory=False)
+                if release_mb:
+                    self.resource_manager.release("gpu_memory", amount=release_mb)
+                self._cache_dirty = True
+                if final:
+                    self._workspace_bytes = 0  # Nothing left to serve; hand the warm pool back too
+                    self._flush_cache()
+                if probe_memory:
+                    gpu_mem_after = torch.cuda.memory_allocated()
+                    self._log_event(
+                        "cleanup_end",
+                        f"Cleanup complete. GPU memory after: {gpu_mem_after}",
+                        level="debug",
+                        additional_info={"gpu_mem_before": gpu_mem_before, "gpu_mem_after": gpu_mem_after}
+                    )
+                    if gpu_mem_after > 0.5 * gpu_mem_before:
+                        self._log_event(
+                            "cleanup_warning",
+                            f"GPU memory not fully released after cleanup. Before: {gpu_mem_before}, After: {gpu_mem_after}",
+                            level="warning"
+                        )
+                    self.report_gpu_memory_usage()
         except Exception as e:
             self.error_manager.handle_error(
                 error=e,
@@ -766,31 +1366,27 @@ class ModelManager:
             )
             raise
 
-    def _validate_config_value(self, key: str, value: Any, expected_type: type, valid_values: Optional[List[Any]] = None, valid_range: Optional[Tuple[Any, Any]] = None) -> Any:
+    def _validate_config_value(self, key: str, value: Any, expected_type: Union[type, Tuple[type, ...]], valid_values: Optional[Collection[Any]] = None, valid_range: Optional[Tuple[Any, Any]] = None) -> Any:
         """Validate a configuration value against type and constraints."""
-        try:
-            # Type validation
-            if not isinstance(value, expected_type):
-                raise ValueError(f"Config {key} must be of type {expected_type.__name__}")
-            
-            # Value validation
-            if valid_values is not None and value not in valid_values:
-                raise ValueError(f"Config {key}={value} not in valid values {valid_values}")
-            
-            # Range validation
-            if valid_range is not None:
-                min_val, max_val = valid_range
-                if not (min_val <= value <= max_val):
-                    raise ValueError(f"Config {key}={value} outside valid range [{min_val}, {max_val}]")
-            
+        # Fast path: a single short-circuit check for the common valid case
+        if (isinstance(value, expected_type)
+                and (valid_values is None or value in valid_values)
+                and (valid_range is None or valid_range[0] <= value <= valid_range[1])):
             return value
-        except Exception as e:
-            self._log_error(
-                f"Config validation failed for {key}: {str(e)}",
-                error_type="config_validation_error",
-                context="config_validation"
-            )
-            raise
+        if not isinstance(value, expected_type):
+            type_names = " or ".join(t.__name__ for t in expected_type) if isinstance(expected_type, tuple) else expected_type.__name__
+            error = f"Config {key} must be of type {type_names}"
+        elif valid_values is not None and value not in valid_values:
+            error = f"Config {key}={value} not in valid values {sorted(valid_values)}"
+        else:
+            min_val, max_val = valid_range
+            error = f"Config {key}={value} outside valid range [{min_val}, {max_val}]"
+        self._log_error(
+            f"Config validation failed for {key}: {error}",
+            error_type="config_validation_error",
+            context="config_validation"
+        )
+        raise ValueError(error)
 
     def _get_model_memory_usage(self, model: Optional[nn.Module]) -> Optional[Dict[str, Any]]:
         """Get memory usage statistics for a model."""
@@ -798,24 +1394,29 @@ class ModelManager:
             return None
             
         try:
-            if torch.cuda.is_available():
-                return {
-                    "allocated": torch.cuda.memory_allocated(),
-                    "reserved": torch.cuda.memory_reserved(),
-                    "max_allocated": torch.cuda.max_memory_allocated()
-                }
+            if self._cuda_available:
+                return self._cuda_memory_snapshot()
             return {
                 "parameters": sum(p.numel() for p in model.parameters()),
                 "buffers": sum(b.numel() for b in model.buffers())
             }
         except Exception as e:
-            self._logger.log_error(
-                error_msg=f"Failed to get memory usage: {str(e)}",
-                error_type="memory_usage_error",
-                stack_trace=traceback.format_exc()
+            self._log_error(
+                f"Failed to get memory usage: {e!r}",
+                error_type="memory_usage_error"
             )
             return None
 
+    @staticmethod
+    def _cuda_memory_snapshot() -> Dict[str, int]:
+        """Read allocated/reserved/peak bytes from one allocator stats snapshot."""
+        stats = torch.cuda.memory_stats()
+        return {name: stats.get(key, 0) for name, key in _CUDA_MEMORY_STAT_KEYS}
+
+    def _debug_logging_enabled(self) -> bool:
+        """True if debug-level records would actually be written."""
+        return sovl_logger.LOGGING_ENABLED and self._logger.should_log("debug")
+
     def _log_event(self, event_type: str, message: str, level: str = "info", **kwargs) -> None:
         """Log an event with standardized format."""
         try:
@@ -828,9 +1429,13 @@ class ModelManager:
         except Exception as e:
             print(f"Failed to log event: {str(e)}")
 
-    def _log_error(self, error_msg: str, error_type: str, stack_trace: Optional[str] = None, **kwargs) -> None:
-        """Log an error with consistent formatting and context."""
+    def _log_error(self, error_msg: str, error_type: str, stack_trace: Optional[str] = None, exc_info: bool = False, **kwargs) -> None:
+        """Log an error with consistent formatting and context.
+        Pass exc_info=True instead of a formatted stack_trace so the traceback is only built if the record is kept.
+        """
         try:
+            if exc_info and stack_trace is None and sovl_logger.LOGGING_ENABLED and self._logger.should_log("ERROR"):
+                stack_trace = traceback.format_exc()
             self._logger.log_error(
                 error_msg=error_msg,
                 error_type=error_type,
@@ -842,106 +1447,41 @@ class ModelManager:
             print(f"Failed to log error: {str(e)}")
 
     def get_base_model(self) -> Optional[nn.Module]:
-        """Return the base model. Thread-safe."""
-        with self._memory_lock:
-            return self.base_model
+        """Return the base model. Thread-safe (lock-free snapshot read)."""
+        return self._model_state.base_model
+
+    def _get_indexed(self, field: str, index: int) -> Any:
+        """Return entry index of a _ModelState sequence field, or None if out of range."""
+        items = getattr(self._model_state, field)
+        if 0 <= index < len(items):
+            return items[index]
+        self._log_event(
+            _INDEX_ERROR_EVENTS[field],
+            f"Invalid {field} index {index}. Available: {len(items)}",
+            level="warning",
+            additional_info={"requested_index": index, "available": len(items)}
+        )
+        return None
 
     def get_scaffold_model(self, index: int = 0) -> Optional[nn.Module]:
-        """Return the scaffold model at the specified index. Thread-safe."""
-        with self._memory_lock:
-            try:
-                num_models = len(self.scaffold_models)
-                if not 0 <= index < num_models:
-                    self._log_event(
-                        "scaffold_model_index_error",
-                        f"Invalid scaffold model index {index}. Available: {num_models}",
-                        level="warning",
-                        additional_info={"requested_index": index, "available_models": num_models}
-                    )
-                    return None
-                return self.scaffold_models[index]
-            except IndexError:
-                self._log_error(
-                    f"Internal error: Index {index} invalid for scaffold_models list of size {len(self.scaffold_models)} despite check.",
-                    "scaffold_model_access_error"
-                )
-                return None
-            except Exception as e:
-                self._log_error(
-                    f"Error accessing scaffold model at index {index}: {str(e)}",
-                    "scaffold_model_access_error",
-                    traceback.format_exc(),
-                    additional_info={"index": index}
-                )
-                return None
+        """Return the scaffold model at the specified index. Thread-safe (lock-free snapshot read)."""
+        return self._get_indexed("scaffold_models", index)
 
     def get_base_tokenizer(self) -> Optional[AutoTokenizer]:
-        """Return the base tokenizer. Thread-safe."""
-        with self._memory_lock:
-            return self.base_tokenizer
+        """Return the base tokenizer. Thread-safe (lock-free snapshot read)."""
+        return self._model_state.base_tokenizer
 
     def get_scaffold_tokenizer(self, index: int = 0) -> Optional[AutoTokenizer]:
-        """Return the scaffold tokenizer at the specified index. Thread-safe."""
-        with self._memory_lock:
-            try:
-                num_tokenizers = len(self.scaffold_tokenizers)
-                if not 0 <= index < num_tokenizers:
-                    self._log_event(
-                        "scaffold_tokenizer_index_error",
-                        f"Invalid scaffold tokenizer index {index}. Available: {num_tokenizers}",
-                        level="warning",
-                        additional_info={"requested_index": index, "available_tokenizers": num_tokenizers}
-                    )
-                    return None
-                return self.scaffold_tokenizers[index]
-            except IndexError:
-                self._log_error(
-                    f"Internal error: Index {index} invalid for scaffold_tokenizers list of size {len(self.scaffold_tokenizers)} despite check.",
-                    "scaffold_tokenizer_access_error"
-                )
-                return None
-            except Exception as e:
-                self._log_error(
-                    f"Error accessing scaffold tokenizer at index {index}: {str(e)}",
-                    "scaffold_tokenizer_access_error",
-                    traceback.format_exc(),
-                    additional_info={"index": index}
-                )
-                return None
+        """Return the scaffold tokenizer at the specified index. Thread-safe (lock-free snapshot read)."""
+        return self._get_indexed("scaffold_tokenizers", index)
 
     def get_scaffold_unk_id(self, index: int = 0) -> Optional[int]:
-        """Return the scaffold unknown token ID at the specified index. Thread-safe."""
-        with self._memory_lock:
-            try:
-                num_ids = len(self.scaffold_unk_ids)
-                if not 0 <= index < num_ids:
-                    self._log_event(
-                        "scaffold_unk_id_index_error",
-                        f"Invalid scaffold unknown token ID index {index}. Available: {num_ids}",
-                        level="warning",
-                        additional_info={"requested_index": index, "available_ids": num_ids}
-                    )
-                    return None
-                return self.scaffold_unk_ids[index]
-            except IndexError:
-                self._log_error(
-                    f"Internal error: Index {index} invalid for scaffold_unk_ids list of size {len(self.scaffold_unk_ids)} despite check.",
-                    "scaffold_unk_id_access_error"
-                )
-                return None
-            except Exception as e:
-                self._log_error(
-                    f"Error accessing scaffold unknown token ID at index {index}: {str(e)}",
-                    "scaffold_unk_id_access_error",
-                    traceback.format_exc(),
-                    additional_info={"index": index}
-                )
-                return None
+        """Return the scaffold unknown token ID at the specified index. Thread-safe (lock-free snapshot read)."""
+        return self._get_indexed("scaffold_unk_ids", index)
 
     def get_num_scaffold_models(self) -> int:
-        """Return the number of available scaffold models. Thread-safe."""
-        with self._memory_lock:
-            return len(self.scaffold_models)
+        """Return the number of available scaffold models. Thread-safe (lock-free snapshot read)."""
+        return len(self._model_state.scaffold_models)
 
     def _initialize_config(self) -> None:
         """Initialize and validate essential configuration parameters."""
@@ -995,8 +1535,44 @@ class ModelManager:
                 "quantization_mode",
                 self._config_manager.get("model_config.quantization_mode", "fp16"),
                 str,
-                valid_values=["int4", "int8", "fp16"]
+                valid_values=_QUANTIZATION_MODES
+            )
+            
+            # Activated-LoRA (opt-in): gate scaffold adapters to tokens after an invocation token
+            self.alora_enabled = self._validate_config_value(
+                "alora_enabled",
+                self._config_manager.get("model_config.alora_enabled", False),
+                bool
             )
+            self._alora_invocation_token_id = self._config_manager.get("model_config.alora_invocation_token_id", None)
+            self._alora_calls = local()  # Per-thread invocation indices of the in-flight scaffold forward
+            
+            # Optional scaffold KV cache quantization (None disables)
+            self.kv_quant_bits = self._config_manager.get("model_config.kv_quant_bits", None)
+            if self.kv_quant_bits is not None:
+                self._validate_config_value("kv_quant_bits", self.kv_quant_bits, int, valid_values=_KV_QUANT_BACKENDS)
+            
+            # Download Hub snapshots in the background while tokenizers and the CUDA pool are set up
+            self.prefetch_snapshots = self._validate_config_value(
+                "prefetch_snapshots",
+                self._config_manager.get("model_config.prefetch_snapshots", False),
+                bool
+            )
+            
+            # Use expandable allocator segments to limit fragmentation across reloads
+            self.use_expandable_segments = self._validate_config_value(
+                "use_expandable_segments",
+                self._config_manager.get("model_config.use_expandable_segments", True),
+                bool
+            )
+            
+            # Share of device memory this process may claim through the CUDA caching allocator
+            self.cuda_memory_fraction = float(self._validate_config_value(
+                "cuda_memory_fraction",
+                self._config_manager.get("model_config.cuda_memory_fraction", 0.9),
+                (int, float),
+                valid_range=(0.1, 1.0)
+            ))
             
             self._log_event(
                 "config_initialization",
@@ -1013,7 +1589,7 @@ class ModelManager:
             self._log_error(
                 f"Failed to initialize configuration: {str(e)}",
                 error_type="config_initialization_error",
-                stack_trace=traceback.format_exc()
+                exc_info=True
             )
             raise
 
@@ -1028,23 +1604,77 @@ class ModelManager:
             level="info"
         )
 
+    def _load_lora_state_dict(self, path: str) -> Dict[str, torch.Tensor]:
+        """
+        Load adapter weights from a PEFT checkpoint directory or weights file onto self._device.
+        On CUDA the tensors are staged in pinned memory and copied with non_blocking=True on a side stream.
+        """
+        if os.path.isdir(path):
+            safetensors_path = os.path.join(path, "adapter_model.safetensors")
+            path = safetensors_path if os.path.exists(safetensors_path) else os.path.join(path, "adapter_model.bin")
+        if path.endswith(".safetensors"):
+            state_dict = load_safetensors(path, device="cpu")
+        else:
+            state_dict = torch.load(path, map_location="cpu")
+        if self._device.type != "cuda" or not self._cuda_available:
+            return state_dict
+        stream = torch.cuda.Stream(device=self._device)
+        with torch.cuda.stream(stream):
+            state_dict = {k: v.pin_memory().to(self._device, non_blocking=True) for k, v in state_dict.items()}
+        stream.synchronize()
+        return state_dict
+
+    def preload_lora_variants(self, name_to_path: Dict[str, str]) -> None:
+        """
+        Load LoRA adapter checkpoints into device-resident state dicts so switch_lora can hot-swap them.
+        Args:
+            name_to_path: Mapping of variant name to a PEFT checkpoint directory or .safetensors file.
+        """
+        for name, path in name_to_path.items():
+            try:
+                self._lora_bank[name] = self._load_lora_state_dict(path)
+            except Exception as e:
+                self._log_error(
+                    f"Failed to preload LoRA variant {name} from {path}: {str(e)}",
+                    error_type="lora_preload_error",
+                    exc_info=True,
+                    additional_info={"variant": name, "path": path}
+                )
+                raise
+        self._log_event(
+            "lora_preload",
+            f"Preloaded {len(name_to_path)} LoRA variants",
+            level="info",
+            additional_info={"variants": list(self._lora_bank)}
+        )
+
+    def switch_lora(self, name: str) -> None:
+        """Activate a preloaded LoRA variant on every scaffold model without touching disk."""
+        if name not in self._lora_bank:
+            raise KeyError(f"LoRA variant '{name}' has not been preloaded")
+        state_dict = self._lora_bank[name]
+        with self._gpu_lock:
+            for scaffold_model in self.scaffold_models:
+                set_peft_model_state_dict(scaffold_model, state_dict)
+        self.active_lora_checkpoint = name
+        self._log_event(
+            "lora_switch",
+            f"Switched active LoRA variant to {name}",
+            level="info",
+            additional_info={"variant": name, "num_scaffolds": len(self.scaffold_models)}
+        )
+
     def report_gpu_memory_usage(self):
         """Report current GPU memory usage for monitoring purposes."""
-        if torch.cuda.is_available():
-            allocated = torch.cuda.memory_allocated()
-            reserved = torch.cuda.memory_reserved()
-            max_allocated = torch.cuda.max_memory_allocated()
+        if self._cuda_available:
+            usage = self._cuda_memory_snapshot()
             self._log_event(
                 "gpu_memory_report",
-                f"GPU memory usage - Allocated: {allocated}, Reserved: {reserved}, Max Allocated: {max_allocated}",
+                f"GPU memory usage - Allocated: {usage['allocated']}, Reserved: {usage['reserved']}, Max Allocated: {usage['max_allocated']}",
                 level="info",
-                additional_info={
-                    "allocated": allocated,
-                    "reserved": reserved,
-                    "max_allocated": max_allocated
-                }
+                additional_info={**usage, "allocator_settings": self._allocator_settings}
             )
-            return {"allocated": allocated, "reserved": reserved, "max_allocated": max_allocated}
+            return usage
         else:
             self._log_event(
                 "gpu_memory_report",
@@ -1056,14 +1686,21 @@ class ModelManager:
     def get_max_context_length(self, model=None) -> int:
         """
         Return the max context length for the given model (or current base model if not specified).
-        Checks common config attributes and falls back to config or a safe default.
+        The base model's value is resolved once per load and cached.
         """
         if model is None:
-            model = self.get_base_model()
-        if model is not None and hasattr(model, "config"):
-            for attr in ['max_position_embeddings', 'n_ctx', 'seq_length', 'max_seq_len']:
-                if hasattr(model.config, attr):
-                    return getattr(model.config, attr)
+            if self._max_context_length_cache is None:
+                self._max_context_length_cache = self._resolve_max_context_length(self.get_base_model())
+            return self._max_context_length_cache
+        return self._resolve_max_context_length(model)
+
+    def _resolve_max_context_length(self, model) -> int:
+        """Check common config attributes on model and fall back to config or a safe default."""
+        model_config = getattr(model, "config", None)
+        for attr in _CTX_ATTRS:
+            value = getattr(model_config, attr, None)
+            if value is not None:
+                return value
         # Fallback to config or a safe default
         if hasattr(self, "_config_manager"):
             return self._config_manager.get("controls_config.max_seq_length", 2048)
@@ -1,47 +1,150 @@
-from typing import Dict, List, Optional, Union
-from dataclasses import dataclass
+import sys
+from typing import Callable, Dict, Optional
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from sovl_config import ConfigSchema
 
-class ValidationSchema:
-    """Schema definitions for SOVL configuration validation."""
+# Allowed values for enum-style string fields
+_LAYER_SELECTION_MODES = frozenset({"balanced", "random", "fixed"})
+_LEGACY_QUANTIZATION_MODES = frozenset({"fp16", "int8", "none"})
+_QUANTIZATION_MODES = frozenset({"fp16", "int8", "int4"})
+_DEVICES = frozenset({"cuda", "cpu"})
+_MODEL_TYPES = frozenset({"causal_lm", "gpt2"})
+_INJECTION_STRATEGIES = frozenset({"sequential", "parallel"})
+_FALLBACK_STRATEGIES = frozenset({"split", "merge", "nearest", "unk"})
+_NORMALIZATION_LEVELS = frozenset({"none", "basic", "aggressive"})
+_CONFLICT_RESOLUTION_STRATEGIES = frozenset({"keep_first", "keep_last", "keep_highest_conf", "merge"})
+_LIFECYCLE_CURVES = frozenset({"sigmoid_linear", "exponential"})
+_SCHEDULER_TYPES = frozenset({"linear", "cosine", "constant"})
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_MEMORY_LOG_LEVELS = frozenset({"debug", "info", "warning", "error", "critical"})
+_DREAM_SELECTION_STRATEGIES = frozenset({"top", "random"})
+_OPTIMIZATION_LEVELS = frozenset({"basic", "moderate", "aggressive"})
+# Keys gestation_config.tiredness_weights must provide
+_TIREDNESS_WEIGHT_KEYS = frozenset({"log", "confidence", "time"})
+
+# Upper bound for core_config.random_seed (inclusive schema range)
+_SEED_MAX = 2**32
+
+@lru_cache(maxsize=None)
+def _in(allowed: frozenset):
+    """
+    Return a membership validator for allowed (frozenset.__contains__, no Python frame per call).
+    Cached, so every field sharing a value set (e.g. the quantization modes) shares one validator object.
+    """
+    return allowed.__contains__
+
+def _all_str(values) -> bool:
+    """True if values is None or a list of strings (map over str.__instancecheck__ runs the loop in C)."""
+    return values is None or (isinstance(values, list) and all(map(str.__instancecheck__, values)))
+
+def _str_to_str_map(mapping) -> bool:
+    """True if mapping is a dict whose keys and values are all strings."""
+    return isinstance(mapping, dict) and all(map(str.__instancecheck__, mapping)) and all(map(str.__instancecheck__, mapping.values()))
+
+def _positive_ints(values) -> bool:
+    """True if every item is an int greater than zero."""
+    return all(isinstance(n, int) and n > 0 for n in values)
+
+@lru_cache(maxsize=None)
+def _subset_of(allowed: frozenset):
+    """Return a validator accepting lists whose items are all strings in allowed."""
+    def validator(values) -> bool:
+        # The str check first guarantees hashable items for the set comparison
+        return isinstance(values, list) and all(map(str.__instancecheck__, values)) and allowed.issuperset(values)
+    return validator
+
+def _req_str(field: str, description: Optional[str] = None) -> ConfigSchema:
+    """Required string field."""
+    return ConfigSchema(field=field, type=str, required=True, description=description)
+
+def _prob(field: str, default: float, description: Optional[str] = None) -> ConfigSchema:
+    """Float field bounded to [0.0, 1.0]."""
+    return ConfigSchema(field=field, type=float, default=default, range=(0.0, 1.0), description=description)
+
+def _pos_int(field: str, default: int, description: Optional[str] = None) -> ConfigSchema:
+    """Integer field that must be at least 1."""
+    return ConfigSchema(field=field, type=int, default=default, range=(1, None), description=description)
+
+def _iter_config_schemas(node):
+    """Yield the ConfigSchema leaves of a (possibly nested) section dict, in definition order."""
+    # Explicit stack instead of recursion: the gestation_weighting JSON Schema nests several levels deep
+    stack = [iter(node.values())]
+    while stack:
+        for value in stack[-1]:
+            if isinstance(value, ConfigSchema):
+                yield value
+            elif isinstance(value, Mapping):
+                stack.append(iter(value.values()))
+                break
+        else:
+            stack.pop()
+
+class _LazySchemaMap(Mapping):
+    """Read-only section -> schema mapping that builds each section on first access and memoizes it."""
+    __slots__ = ("_builders", "_cache")
+
+    def __init__(self, builders: Dict[str, Callable[[], Dict[str, ConfigSchema]]]):
+        self._builders = builders
+        self._cache: Dict[str, Mapping[str, ConfigSchema]] = {}
+
+    def __getitem__(self, section: str) -> Mapping[str, ConfigSchema]:
+        fields = self._cache.get(section)
+        if fields is None:
+            # A concurrent first access may build twice; setdefault keeps a single shared result
+            fields = self._cache.setdefault(section, MappingProxyType(self._builders[section]()))
+        return fields
+
+    def __iter__(self):
+        return iter(self._builders)
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+class _SectionAccess(type):
+    """Expose schema sections as class attributes, e.g. ValidationSchema.training_config."""
+
+    def __getattr__(cls, name: str):
+        schema = cls.get_schema()
+        if name.startswith("__") or name not in schema:
+            raise AttributeError(f"{cls.__name__} has no attribute or schema section '{name}'")
+        section = schema[name]
+        # Cache on the class so later reads are plain attribute lookups that never reach __getattr__
+        setattr(cls, name, section)
+        return section
+
+class ValidationSchema(metaclass=_SectionAccess):
+    """
+    Schema definitions for SOVL configuration validation.
+    Sections are also readable as class attributes (ValidationSchema.training_config).
+    """
     
     @staticmethod
-    def get_schema() -> Dict[str, Dict[str, ConfigSchema]]:
-        """Return the configuration schema."""
-        return {
-            "core_config": ValidationSchema._get_core_config_schema(),
-            "model": ValidationSchema._get_model_schema(),
-            "controls_config": ValidationSchema._get_controls_config_schema(),
-            "temperament_config": ValidationSchema._get_temperament_config_schema(),
-            "training_config": ValidationSchema._get_training_config_schema(),
-            "scaffold_config": ValidationSchema._get_scaffold_config_schema(),
-            "dynamic_weighting": ValidationSchema._get_dynamic_weighting_schema(),
-            "curiosity_config": ValidationSchema._get_curiosity_config_schema(),
-            "cross_attn_config": ValidationSchema._get_cross_attn_config_schema(),
-            "logging_config": ValidationSchema._get_logging_config_schema(),
-            "error_config": ValidationSchema._get_error_config_schema(),
-            "generation_config": ValidationSchema._get_generation_config_schema(),
-            "data_config": ValidationSchema._get_data_config_schema(),
-            "data_provider": ValidationSchema._get_data_provider_schema(),
-            "memory_config": ValidationSchema._get_memory_config_schema(),
-            "state_config": ValidationSchema._get_state_config_schema(),
-            "confidence_config": ValidationSchema._get_confidence_config_schema(),
-            "gestation_config": ValidationSchema._get_gestation_config_schema(),
-            "gestation_weighting": ValidationSchema._get_gestation_weighting_schema(),
-            "monitoring": ValidationSchema._get_monitoring_schema(),
-            "scribed_config": ValidationSchema._get_scribed_config_schema(),
-            "io_config": ValidationSchema._get_io_config_schema(),
-            "metrics_config": ValidationSchema._get_metrics_config_schema(),
-            "trainer_weighting": ValidationSchema._get_metadata_weighting_schema(),
-            "dreamer_config": ValidationSchema._get_dreamer_config_schema(),
-            "gestation_weighting": ValidationSchema._get_gestation_weighting_schema(),
-        }
+    @lru_cache(maxsize=None)
+    def get_schema() -> Mapping[str, Mapping[str, ConfigSchema]]:
+        """
+        Return the configuration schema. Shared per process and read-only;
+        each section is only built the first time it is accessed.
+        """
+        return _LazySchemaMap(dict(_SECTION_BUILDERS))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_flat_schema() -> Mapping[str, ConfigSchema]:
+        """Return every ConfigSchema keyed by its dotted field path, sharing instances with get_schema()."""
+        schema = ValidationSchema.get_schema()
+        return MappingProxyType({
+            config_schema.field: config_schema
+            for section in schema
+            for config_schema in _iter_config_schemas(schema[section])
+        })
 
     @staticmethod
     def _get_core_config_schema() -> Dict[str, ConfigSchema]:
         """Return the core_config schema."""
         return {
-            "base_model_name": ConfigSchema(field="core_config.base_model_name", type=str, required=True),
+            "base_model_name": _req_str("core_config.base_model_name"),
             "base_model_path": ConfigSchema(field="core_config.base_model_path", type=str, default=None, nullable=True),
             "scaffold_model_name": ConfigSchema(
                 field="core_config.scaffold_model_name", 
@@ -56,33 +159,33 @@ class ValidationSchema:
                 required=False, 
                 default=None, 
                 nullable=True,
-                validator=lambda x: all(isinstance(i, str) for i in x) if x is not None else True
+                validator=_all_str
             ),
             "scaffold_model_path": ConfigSchema(field="core_config.scaffold_model_path", type=str, default=None, nullable=True),
             "cross_attn_layers": ConfigSchema(field="core_config.cross_attn_layers", type=list, default=[4, 6]),
             "use_dynamic_layers": ConfigSchema(field="core_config.use_dynamic_layers", type=bool, default=False),
-            "layer_selection_mode": ConfigSchema(field="core_config.layer_selection_mode", type=str, default="balanced", validator=lambda x: x in ["balanced", "random", "fixed"]),
+            "layer_selection_mode": ConfigSchema(field="core_config.layer_selection_mode", type=str, default="balanced", validator=_in(_LAYER_SELECTION_MODES)),
             "custom_layers": ConfigSchema(field="core_config.custom_layers", type=list, default=None, nullable=True),
-            "valid_split_ratio": ConfigSchema(field="core_config.valid_split_ratio", type=float, default=0.2, range=(0.0, 1.0)),
-            "random_seed": ConfigSchema(field="core_config.random_seed", type=int, default=42, range=(0, 2**32)),
-            "quantization": ConfigSchema(field="core_config.quantization", type=str, default="fp16", validator=lambda x: x in ["fp16", "int8", "none"]),
-            "valid_quantization_modes": ConfigSchema(field="core_config.valid_quantization_modes", type=list, default=["fp16", "int8", "int4"], validator=lambda x: all(isinstance(i, str) and i in ["fp16", "int8", "int4"] for i in x)),
-            "default_quantization_mode": ConfigSchema(field="core_config.default_quantization_mode", type=str, default="fp16", validator=lambda x: x in ["fp16", "int8", "int4"]),
-            "hidden_size": ConfigSchema(field="core_config.hidden_size", type=int, default=768, range=(1, None)),
-            "num_heads": ConfigSchema(field="core_config.num_heads", type=int, default=12, range=(1, None)),
+            "valid_split_ratio": _prob("core_config.valid_split_ratio", 0.2),
+            "random_seed": ConfigSchema(field="core_config.random_seed", type=int, default=42, range=(0, _SEED_MAX)),
+            "quantization": ConfigSchema(field="core_config.quantization", type=str, default="fp16", validator=_in(_LEGACY_QUANTIZATION_MODES)),
+            "valid_quantization_modes": ConfigSchema(field="core_config.valid_quantization_modes", type=list, default=["fp16", "int8", "int4"], validator=_subset_of(_QUANTIZATION_MODES)),
+            "default_quantization_mode": ConfigSchema(field="core_config.default_quantization_mode", type=str, default="fp16", validator=_in(_QUANTIZATION_MODES)),
+            "hidden_size": _pos_int("core_config.hidden_size", 768),
+            "num_heads": _pos_int("core_config.num_heads", 12),
             "gradient_checkpointing": ConfigSchema(field="core_config.gradient_checkpointing", type=bool, default=True),
             "initializer_range": ConfigSchema(field="core_config.initializer_range", type=float, default=0.02, range=(0.0, None)),
             "migration_mode": ConfigSchema(field="core_config.migration_mode", type=bool, default=True),
-            "device": ConfigSchema(field="core_config.device", type=str, default="cuda", validator=lambda x: x in ["cuda", "cpu"]),
+            "device": ConfigSchema(field="core_config.device", type=str, default="cuda", validator=_in(_DEVICES)),
         }
 
     @staticmethod
     def _get_model_schema() -> Dict[str, ConfigSchema]:
         """Return the model schema."""
         return {
-            "model_path": ConfigSchema(field="model.model_path", type=str, required=True),
-            "model_type": ConfigSchema(field="model.model_type", type=str, default="causal_lm", validator=lambda x: x in ["causal_lm", "gpt2"]),
-            "quantization_mode": ConfigSchema(field="model.quantization_mode", type=str, default="fp16", validator=lambda x: x in ["fp16", "int8", "none"]),
+            "model_path": _req_str("model.model_path"),
+            "model_type": ConfigSchema(field="model.model_type", type=str, default="causal_lm", validator=_in(_MODEL_TYPES)),
+            "quantization_mode": ConfigSchema(field="model.quantization_mode", type=str, default="fp16", validator=_in(_LEGACY_QUANTIZATION_MODES)),
         }
 
     @staticmethod
@@ -99,11 +202,11 @@ class ValidationSchema:
     def _get_bonding_config_schema() -> Dict[str, ConfigSchema]:
         """Return the bonding_config schema."""
         return {
-            "strong_bond_threshold": ConfigSchema(field="bonding_config.strong_bond_threshold", type=float, default=0.8, range=(0.0, 1.0)),
-            "weak_bond_threshold": ConfigSchema(field="bonding_config.weak_bond_threshold", type=float, default=0.3, range=(0.0, 1.0)),
-            "default_bond_score": ConfigSchema(field="bonding_config.default_bond_score", type=float, default=0.5, range=(0.0, 1.0)),
-            "bond_decay_rate": ConfigSchema(field="bonding_config.bond_decay_rate", type=float, default=0.01, range=(0.0, 1.0)),
-            "bond_memory_window": ConfigSchema(field="bonding_config.bond_memory_window", type=int, default=100, range=(1, None)),
+            "strong_bond_threshold": _prob("bonding_config.strong_bond_threshold", 0.8),
+            "weak_bond_threshold": _prob("bonding_config.weak_bond_threshold", 0.3),
+            "default_bond_score": _prob("bonding_config.default_bond_score", 0.5),
+            "bond_decay_rate": _prob("bonding_config.bond_decay_rate", 0.01),
+            "bond_memory_window": _pos_int("bonding_config.bond_memory_window", 100),
             "interaction_weight": ConfigSchema(field="bonding_config.interaction_weight", type=float, default=1.0, range=(0.0, None)),
             "modality_weights": ConfigSchema(field="bonding_config.modality_weights", type=dict, default={"text": 1.0, "face": 0.5, "voice": 0.5}),
             "context_strong": ConfigSchema(field="bonding_config.context_strong", type=str, default="You feel a strong, trusting connection to this user. Be warm, open, and familiar."),
@@ -118,46 +221,46 @@ class ValidationSchema:
         """Return the controls_config schema."""
         return {
             "enable_scaffold": ConfigSchema(field="controls_config.enable_scaffold", type=bool, default=True),
-            "scaffold_weight_cap": ConfigSchema(field="controls_config.scaffold_weight_cap", type=float, default=0.5, range=(0.0, 1.0)),
+            "scaffold_weight_cap": _prob("controls_config.scaffold_weight_cap", 0.5),
             "scaffold_unk_id": ConfigSchema(field="controls_config.scaffold_unk_id", type=int, default=0, range=(0, None)),
             "enable_cross_attention": ConfigSchema(field="controls_config.enable_cross_attention", type=bool, default=True),
             "enable_dynamic_cross_attention": ConfigSchema(field="controls_config.enable_dynamic_cross_attention", type=bool, default=False),
-            "injection_strategy": ConfigSchema(field="controls_config.injection_strategy", type=str, default="sequential", validator=lambda x: x in ["sequential", "parallel"]),
-            "blend_strength": ConfigSchema(field="controls_config.blend_strength", type=float, default=0.5, range=(0.0, 1.0)),
-            "attention_weight": ConfigSchema(field="controls_config.attention_weight", type=float, default=0.5, range=(0.0, 1.0)),
+            "injection_strategy": ConfigSchema(field="controls_config.injection_strategy", type=str, default="sequential", validator=_in(_INJECTION_STRATEGIES)),
+            "blend_strength": _prob("controls_config.blend_strength", 0.5),
+            "attention_weight": _prob("controls_config.attention_weight", 0.5),
             "max_tokens_per_mapping": ConfigSchema(field="controls_config.max_tokens_per_mapping", type=int, default=3, range=(1, 5)),
-            "mapping_similarity_threshold": ConfigSchema(field="controls_config.mapping_similarity_threshold", type=float, default=0.7, range=(0.0, 1.0)),
+            "mapping_similarity_threshold": _prob("controls_config.mapping_similarity_threshold", 0.7),
             "allow_bidirectional_mapping": ConfigSchema(field="controls_config.allow_bidirectional_mapping", type=bool, default=False),
-            "fallback_strategy": ConfigSchema(field="controls_config.fallback_strategy", type=str, default="split", validator=lambda x: x in ["split", "merge", "nearest", "unk"]),
-            "normalization_level": ConfigSchema(field="controls_config.normalization_level", type=str, default="basic", validator=lambda x: x in ["none", "basic", "aggressive"]),
-            "min_semantic_similarity": ConfigSchema(field="controls_config.min_semantic_similarity", type=float, default=0.5, range=(0.0, 1.0)),
-            "max_meaning_drift": ConfigSchema(field="controls_config.max_meaning_drift", type=float, default=0.3, range=(0.0, 1.0)),
+            "fallback_strategy": ConfigSchema(field="controls_config.fallback_strategy", type=str, default="split", validator=_in(_FALLBACK_STRATEGIES)),
+            "normalization_level": ConfigSchema(field="controls_config.normalization_level", type=str, default="basic", validator=_in(_NORMALIZATION_LEVELS)),
+            "min_semantic_similarity": _prob("controls_config.min_semantic_similarity", 0.5),
+            "max_meaning_drift": _prob("controls_config.max_meaning_drift", 0.3),
             "enable_periodic_validation": ConfigSchema(field="controls_config.enable_periodic_validation", type=bool, default=True),
-            "conflict_resolution_strategy": ConfigSchema(field="controls_config.conflict_resolution_strategy", type=str, default="keep_highest_conf", validator=lambda x: x in ["keep_first", "keep_last", "keep_highest_conf", "merge"]),
+            "conflict_resolution_strategy": ConfigSchema(field="controls_config.conflict_resolution_strategy", type=str, default="keep_highest_conf", validator=_in(_CONFLICT_RESOLUTION_STRATEGIES)),
         }
 
     @staticmethod
     def _get_temperament_config_schema() -> Dict[str, ConfigSchema]:
         """Return the temperament_config schema."""
         return {
-            "mood_influence": ConfigSchema(field="temperament_config.mood_influence", type=float, default=0.3, range=(0.0, 1.0)),
-            "history_maxlen": ConfigSchema(field="temperament_config.history_maxlen", type=int, default=5, range=(1, None)),
-            "temp_eager_threshold": ConfigSchema(field="temperament_config.temp_eager_threshold", type=float, default=0.7, range=(0.0, 1.0)),
-            "temp_sluggish_threshold": ConfigSchema(field="temperament_config.temp_sluggish_threshold", type=float, default=0.3, range=(0.0, 1.0)),
-            "temp_mood_influence": ConfigSchema(field="temperament_config.temp_mood_influence", type=float, default=0.3, range=(0.0, 1.0)),
-            "temp_curiosity_boost": ConfigSchema(field="temperament_config.temp_curiosity_boost", type=float, default=0.2, range=(0.0, 1.0)),
-            "temp_restless_drop": ConfigSchema(field="temperament_config.temp_restless_drop", type=float, default=0.2, range=(0.0, 1.0)),
+            "mood_influence": _prob("temperament_config.mood_influence", 0.3),
+            "history_maxlen": _pos_int("temperament_config.history_maxlen", 5),
+            "temp_eager_threshold": _prob("temperament_config.temp_eager_threshold", 0.7),
+            "temp_sluggish_threshold": _prob("temperament_config.temp_sluggish_threshold", 0.3),
+            "temp_mood_influence": _prob("temperament_config.temp_mood_influence", 0.3),
+            "temp_curiosity_boost": _prob("temperament_config.temp_curiosity_boost", 0.2),
+            "temp_restless_drop": _prob("temperament_config.temp_restless_drop", 0.2),
             "temp_melancholy_noise": ConfigSchema(field="temperament_config.temp_melancholy_noise", type=float, default=0.02, range=(0.0, 0.1)),
-            "conf_feedback_strength": ConfigSchema(field="temperament_config.conf_feedback_strength", type=float, default=0.5, range=(0.0, 1.0)),
-            "temp_smoothing_factor": ConfigSchema(field="temperament_config.temp_smoothing_factor", type=float, default=0.5, range=(0.0, 1.0)),
-            "temperament_decay_rate": ConfigSchema(field="temperament_config.temperament_decay_rate", type=float, default=0.9, range=(0.0, 1.0)),
-            "temperament_history_maxlen": ConfigSchema(field="temperament_config.temperament_history_maxlen", type=int, default=5, range=(1, None)),
-            "confidence_history_maxlen": ConfigSchema(field="temperament_config.confidence_history_maxlen", type=int, default=5, range=(1, None)),
-            "temperament_pressure_threshold": ConfigSchema(field="temperament_config.temperament_pressure_threshold", type=float, default=0.5, range=(0.0, 1.0)),
-            "temperament_max_pressure": ConfigSchema(field="temperament_config.temperament_max_pressure", type=float, default=1.0, range=(0.0, 1.0)),
-            "temperament_min_pressure": ConfigSchema(field="temperament_config.temperament_min_pressure", type=float, default=0.0, range=(0.0, 1.0)),
-            "temperament_confidence_adjustment": ConfigSchema(field="temperament_config.temperament_confidence_adjustment", type=float, default=0.5, range=(0.0, 1.0)),
-            "temperament_pressure_drop": ConfigSchema(field="temperament_config.temperament_pressure_drop", type=float, default=0.2, range=(0.0, 1.0)),
+            "conf_feedback_strength": _prob("temperament_config.conf_feedback_strength", 0.5),
+            "temp_smoothing_factor": _prob("temperament_config.temp_smoothing_factor", 0.5),
+            "temperament_decay_rate": _prob("temperament_config.temperament_decay_rate", 0.9),
+            "temperament_history_maxlen": _pos_int("temperament_config.temperament_history_maxlen", 5),
+            "confidence_history_maxlen": _pos_int("temperament_config.confidence_history_maxlen", 5),
+            "temperament_pressure_threshold": _prob("temperament_config.temperament_pressure_threshold", 0.5),
+            "temperament_max_pressure": _prob("temperament_config.temperament_max_pressure", 1.0),
+            "temperament_min_pressure": _prob("temperament_config.temperament_min_pressure", 0.0),
+            "temperament_confidence_adjustment": _prob("temperament_config.temperament_confidence_adjustment", 0.5),
+            "temperament_pressure_drop": _prob("temperament_config.temperament_pressure_drop", 0.2),
             "lifecycle_params": ConfigSchema(field="temperament_config.lifecycle_params", type=dict, default={
                 "gestation": {"bias": 0.1, "decay": 1.0},
                 "active": {"bias": 0.0, "decay": 0.9},
@@ -165,80 +268,14 @@ class ValidationSchema:
             }),
         }
 
-    @staticmethod
-    def _get_training_config_schema() -> Dict[str, ConfigSchema]:
-        """Return the training_config schema."""
-        return {
-            "model_name": ConfigSchema(field="training_config.model_name", type=str, default="SmolLM2-360M"),
-            "learning_rate": ConfigSchema(field="training_config.learning_rate", type=float, default=1.5e-5, range=(0.0, None), required=True),
-            "train_epochs": ConfigSchema(field="training_config.train_epochs", type=int, default=1, range=(1, None)),
-            "batch_size": ConfigSchema(field="training_config.batch_size", type=int, default=2, range=(1, None), required=True),
-            "max_seq_length": ConfigSchema(field="training_config.max_seq_length", type=int, default=512, range=(1, None)),
-            "sigmoid_scale": ConfigSchema(field="training_config.sigmoid_scale", type=float, default=0.5, range=(0.0, None)),
-            "sigmoid_shift": ConfigSchema(field="training_config.sigmoid_shift", type=float, default=3.0, range=(0.0, None)),
-            "lifecycle_capacity_factor": ConfigSchema(field="training_config.lifecycle_capacity_factor", type=float, default=0.01, range=(0.0, None)),
-            "lifecycle_curve": ConfigSchema(field="training_config.lifecycle_curve", type=str, default="sigmoid_linear", validator=lambda x: x in ["sigmoid_linear", "exponential"]),
-            "grad_accum_steps": ConfigSchema(field="training_config.grad_accum_steps", type=int, default=4, range=(1, None)),
-            "exposure_gain_eager": ConfigSchema(field="training_config.exposure_gain_eager", type=int, default=2, range=(1, None)),
-            "exposure_gain_default": ConfigSchema(field="training_config.exposure_gain_default", type=int, default=2, range=(1, None)),
-            "max_patience": ConfigSchema(field="training_config.max_patience", type=int, default=2, range=(0, None)),
-            "dry_run": ConfigSchema(field="training_config.dry_run", type=bool, default=False),
-            "dry_run_params": ConfigSchema(field="training_config.dry_run_params", type=dict, default={
-                "max_samples": 4,
-                "max_length": 128,
-                "validate_architecture": True,
-                "skip_training": True
-            }),
-            "weight_decay": ConfigSchema(field="training_config.weight_decay", type=float, default=0.01, range=(0.0, None)),
-            "max_grad_norm": ConfigSchema(field="training_config.max_grad_norm", type=float, default=1.0, range=(0.0, None)),
-            "use_amp": ConfigSchema(field="training_config.use_amp", type=bool, default=True),
-            "checkpoint_interval": ConfigSchema(field="training_config.checkpoint_interval", type=int, default=1000, range=(1, None)),
-            "scheduler_type": ConfigSchema(field="training_config.scheduler_type", type=str, default="linear", validator=lambda x: x in ["linear", "cosine", "constant"]),
-            "cosine_min_lr": ConfigSchema(field="training_config.cosine_min_lr", type=float, default=1e-6, range=(0.0, None)),
-            "warmup_ratio": ConfigSchema(field="training_config.warmup_ratio", type=float, default=0.1, range=(0.0, 1.0)),
-            "warmup_steps": ConfigSchema(field="training_config.warmup_steps", type=int, default=300, range=(0, None)),
-            "total_steps": ConfigSchema(field="training_config.total_steps", type=int, default=5000, range=(1, None)),
-            "validate_every_n_steps": ConfigSchema(field="training_config.validate_every_n_steps", type=int, default=100, range=(1, None)),
-            "checkpoint_path": ConfigSchema(field="training_config.checkpoint_path", type=str, default="checkpoints/sovl_trainer"),
-            "dropout_rate": ConfigSchema(field="training_config.dropout_rate", type=float, default=0.1, range=(0.0, 1.0)),
-            "max_epochs": ConfigSchema(field="training_config.max_epochs", type=int, default=1, range=(1, None)),
-            "metrics_to_track": ConfigSchema(field="training_config.metrics_to_track", type=list, default=["loss", "accuracy", "confidence"]),
-            "enable_gestation": ConfigSchema(field="training_config.enable_gestation", type=bool, default=True),
-            "enable_sleep_training": ConfigSchema(field="training_config.enable_sleep_training", type=bool, default=True),
-            "enable_lifecycle_weighting": ConfigSchema(field="training_config.enable_lifecycle_weighting", type=bool, default=True),
-            "sleep_conf_threshold": ConfigSchema(field="training_config.sleep_conf_threshold", type=float, default=0.7, range=(0.0, 1.0)),
-            "sleep_log_min": ConfigSchema(field="training_config.sleep_log_min", type=int, default=10, range=(1, None)),
-            "dream_memory_weight": ConfigSchema(field="training_config.dream_memory_weight", type=float, default=0.03, range=(0.0, 1.0)),
-            "enable_dreaming": ConfigSchema(field="training_config.enable_dreaming", type=bool, default=True),
-            "repetition_n": ConfigSchema(field="training_config.repetition_n", type=int, default=3, range=(2, None)),
-            "dream_noise_scale": ConfigSchema(field="training_config.dream_noise_scale", type=float, default=0.01, range=(0.0, None)),
-            "dream_prompt_weight": ConfigSchema(field="training_config.dream_prompt_weight", type=float, default=0.5, range=(0.0, 1.0)),
-            "dream_novelty_boost": ConfigSchema(field="training_config.dream_novelty_boost", type=float, default=0.03, range=(0.0, None)),
-            "dream_memory_decay": ConfigSchema(field="training_config.dream_memory_decay", type=float, default=0.95, range=(0.0, 1.0)),
-            "dream_prune_threshold": ConfigSchema(field="training_config.dream_prune_threshold", type=float, default=0.1, range=(0.0, 1.0)),
-            "enable_prompt_driven_dreams": ConfigSchema(field="training_config.enable_prompt_driven_dreams", type=bool, default=True),
-            "dream_swing_var": ConfigSchema(field="training_config.dream_swing_var", type=float, default=0.1, range=(0.0, None)),
-            "dream_lifecycle_delta": ConfigSchema(field="training_config.dream_lifecycle_delta", type=float, default=0.1, range=(0.0, None)),
-            "dream_temperament_on": ConfigSchema(field="training_config.dream_temperament_on", type=bool, default=False),
-            "confidence_history_maxlen": ConfigSchema(field="training_config.confidence_history_maxlen", type=int, default=5, range=(1, None)),
-            "temperament_history_maxlen": ConfigSchema(field="training_config.temperament_history_maxlen", type=int, default=5, range=(1, None)),
-            "memory_threshold": ConfigSchema(field="training_config.memory_threshold", type=float, default=0.85, range=(0.0, 1.0)),
-            "memory_decay_rate": ConfigSchema(field="training_config.memory_decay_rate", type=float, default=0.95, range=(0.0, 1.0)),
-            "use_scaffold_memory": ConfigSchema(field="training_config.use_scaffold_memory", type=bool, default=True),
-            "use_token_map_memory": ConfigSchema(field="training_config.use_token_map_memory", type=bool, default=True),
-            "scaffold_weight": ConfigSchema(field="training_config.scaffold_weight", type=float, default=0.3, range=(0.0, None)),
-            "max_dream_memory_mb": ConfigSchema(field="training_config.max_dream_memory_mb", type=int, default=128, range=(1, None)),
-            "dream_memory_maxlen": ConfigSchema(field="training_config.dream_memory_maxlen", type=int, default=3, range=(1, None)),
-        }
-
     @staticmethod
     def _get_scaffold_config_schema() -> Dict[str, ConfigSchema]:
         """Return the scaffold_config schema."""
         return {
-            "model_path": ConfigSchema(field="scaffold_config.model_path", type=str, required=True),
+            "model_path": _req_str("scaffold_config.model_path"),
             "model_type": ConfigSchema(field="scaffold_config.model_type", type=str, default="gpt2"),
-            "tokenizer_path": ConfigSchema(field="scaffold_config.tokenizer_path", type=str, required=True),
-            "quantization_mode": ConfigSchema(field="scaffold_config.quantization_mode", type=str, default="int8", validator=lambda x: x in ["fp16", "int8", "none"]),
+            "tokenizer_path": _req_str("scaffold_config.tokenizer_path"),
+            "quantization_mode": ConfigSchema(field="scaffold_config.quantization_mode", type=str, default="int8", validator=_in(_LEGACY_QUANTIZATION_MODES)),
         }
 
     @staticmethod
@@ -248,8 +285,8 @@ class ValidationSchema:
             "min_weight": ConfigSchema(field="dynamic_weighting.min_weight", type=float, default=0.0, range=(0.0, None)),
             "max_weight": ConfigSchema(field="dynamic_weighting.max_weight", type=float, default=1.0, range=(0.0, None)),
             "weight_decay": ConfigSchema(field="dynamic_weighting.weight_decay", type=float, default=0.01, range=(0.0, None)),
-            "momentum": ConfigSchema(field="dynamic_weighting.momentum", type=float, default=0.9, range=(0.0, 1.0)),
-            "history_size": ConfigSchema(field="dynamic_weighting.history_size", type=int, default=5, range=(1, None)),
+            "momentum": _prob("dynamic_weighting.momentum", 0.9),
+            "history_size": _pos_int("dynamic_weighting.history_size", 5),
             "enable_dynamic_scaling": ConfigSchema(field="dynamic_weighting.enable_dynamic_scaling", type=bool, default=True),
             "weight_curves": ConfigSchema(field="dynamic_weighting.weight_curves", type=list, default=["linear", "sigmoid_linear"]),
         }
@@ -259,21 +296,21 @@ class ValidationSchema:
         """Return the introspection_config schema."""
         return {
             "enable": ConfigSchema(field="introspection_config.enable", type=bool, default=True),
-            "min_curiosity_trigger": ConfigSchema(field="introspection_config.min_curiosity_trigger", type=float, default=0.7, range=(0.0, 1.0)),
-            "max_confidence_trigger": ConfigSchema(field="introspection_config.max_confidence_trigger", type=float, default=0.4, range=(0.0, 1.0)),
+            "min_curiosity_trigger": _prob("introspection_config.min_curiosity_trigger", 0.7),
+            "max_confidence_trigger": _prob("introspection_config.max_confidence_trigger", 0.4),
             "triggering_moods": ConfigSchema(field="introspection_config.triggering_moods", type=list, default=["cautious", "melancholy"]),
-            "cooldown_seconds": ConfigSchema(field="introspection_config.cooldown_seconds", type=int, default=30, range=(1, None)),
-            "base_approval_threshold": ConfigSchema(field="introspection_config.base_approval_threshold", type=float, default=0.6, range=(0.0, 1.0)),
+            "cooldown_seconds": _pos_int("introspection_config.cooldown_seconds", 30),
+            "base_approval_threshold": _prob("introspection_config.base_approval_threshold", 0.6),
             "status_phrases": ConfigSchema(field="introspection_config.status_phrases", type=list, default=["Processing...", "Considering carefully...", "Reviewing perspectives..."]),
             "debug_mode": ConfigSchema(field="introspection_config.debug_mode", type=bool, default=False),
-            "followup_depth": ConfigSchema(field="introspection_config.followup_depth", type=int, default=3, range=(1, None)),
-            "max_followup_depth": ConfigSchema(field="introspection_config.max_followup_depth", type=int, default=4, range=(1, None)),
-            "confidence_threshold": ConfigSchema(field="introspection_config.confidence_threshold", type=float, default=None, range=(0.0, 1.0)),
-            "batch_size": ConfigSchema(field="introspection_config.batch_size", type=int, default=4, range=(1, None)),
-            "dialogue_maxlen": ConfigSchema(field="introspection_config.dialogue_maxlen", type=int, default=100, range=(1, None)),
+            "followup_depth": _pos_int("introspection_config.followup_depth", 3),
+            "max_followup_depth": _pos_int("introspection_config.max_followup_depth", 4),
+            "confidence_threshold": _prob("introspection_config.confidence_threshold", None),
+            "batch_size": _pos_int("introspection_config.batch_size", 4),
+            "dialogue_maxlen": _pos_int("introspection_config.dialogue_maxlen", 100),
             "introspect_min_interval": ConfigSchema(field="introspection_config.introspect_min_interval", type=float, default=0.5, range=(0.0, None)),
-            "topic_window_messages": ConfigSchema(field="introspection_config.topic_window_messages", type=int, default=15, range=(1, None)),
-            "time_window_seconds": ConfigSchema(field="introspection_config.time_window_seconds", type=int, default=600, range=(1, None)),
+            "topic_window_messages": _pos_int("introspection_config.topic_window_messages", 15),
+            "time_window_seconds": _pos_int("introspection_config.time_window_seconds", 600),
             "ethical_introspection": ConfigSchema(
                 field="introspection_config.ethical_introspection",
                 type=dict,
@@ -301,29 +338,29 @@ class ValidationSchema:
         """Return the curiosity_config schema."""
         return {
             "enable_curiosity": ConfigSchema(field="curiosity_config.enable_curiosity", type=bool, default=True),
-            "attention_weight": ConfigSchema(field="curiosity_config.attention_weight", type=float, default=0.3, range=(0.0, 1.0)),
-            "queue_maxlen": ConfigSchema(field="curiosity_config.queue_maxlen", type=int, default=50, range=(1, None)),
-            "novelty_history_maxlen": ConfigSchema(field="curiosity_config.novelty_history_maxlen", type=int, default=20, range=(1, None)),
-            "decay_rate": ConfigSchema(field="curiosity_config.decay_rate", type=float, default=0.95, range=(0.0, 1.0)),
+            "attention_weight": _prob("curiosity_config.attention_weight", 0.3),
+            "queue_maxlen": _pos_int("curiosity_config.queue_maxlen", 50),
+            "novelty_history_maxlen": _pos_int("curiosity_config.novelty_history_maxlen", 20),
+            "decay_rate": _prob("curiosity_config.decay_rate", 0.95),
             "question_timeout": ConfigSchema(field="curiosity_config.question_timeout", type=float, default=1800.0, range=(0.0, None)),
-            "novelty_threshold_spontaneous": ConfigSchema(field="curiosity_config.novelty_threshold_spontaneous", type=float, default=0.8, range=(0.0, 1.0)),
-            "novelty_threshold_response": ConfigSchema(field="curiosity_config.novelty_threshold_response", type=float, default=0.8, range=(0.0, 1.0)),
-            "pressure_threshold": ConfigSchema(field="curiosity_config.pressure_threshold", type=float, default=0.55, range=(0.0, 1.0)),
-            "pressure_drop": ConfigSchema(field="curiosity_config.pressure_drop", type=float, default=0.3, range=(0.0, 1.0)),
+            "novelty_threshold_spontaneous": _prob("curiosity_config.novelty_threshold_spontaneous", 0.8),
+            "novelty_threshold_response": _prob("curiosity_config.novelty_threshold_response", 0.8),
+            "pressure_threshold": _prob("curiosity_config.pressure_threshold", 0.55),
+            "pressure_drop": _prob("curiosity_config.pressure_drop", 0.3),
             "silence_threshold": ConfigSchema(field="curiosity_config.silence_threshold", type=float, default=20.0, range=(0.0, None)),
             "question_cooldown": ConfigSchema(field="curiosity_config.question_cooldown", type=float, default=60.0, range=(0.0, None)),
-            "weight_ignorance": ConfigSchema(field="curiosity_config.weight_ignorance", type=float, default=0.7, range=(0.0, 1.0)),
-            "weight_novelty": ConfigSchema(field="curiosity_config.weight_novelty", type=float, default=0.3, range=(0.0, 1.0)),
-            "max_new_tokens": ConfigSchema(field="curiosity_config.max_new_tokens", type=int, default=8, range=(1, None)),
+            "weight_ignorance": _prob("curiosity_config.weight_ignorance", 0.7),
+            "weight_novelty": _prob("curiosity_config.weight_novelty", 0.3),
+            "max_new_tokens": _pos_int("curiosity_config.max_new_tokens", 8),
             "base_temperature": ConfigSchema(field="curiosity_config.base_temperature", type=float, default=1.1, range=(0.0, None)),
-            "temperament_influence": ConfigSchema(field="curiosity_config.temperament_influence", type=float, default=0.4, range=(0.0, 1.0)),
-            "top_k": ConfigSchema(field="curiosity_config.top_k", type=int, default=30, range=(1, None)),
-            "max_memory_mb": ConfigSchema(field="curiosity_config.max_memory_mb", type=int, default=128, range=(1, None)),
+            "temperament_influence": _prob("curiosity_config.temperament_influence", 0.4),
+            "top_k": _pos_int("curiosity_config.top_k", 30),
+            "max_memory_mb": _pos_int("curiosity_config.max_memory_mb", 128),
             "pressure_change_cooldown": ConfigSchema(field="curiosity_config.pressure_change_cooldown", type=float, default=60.0, range=(0.0, None)),
-            "min_pressure": ConfigSchema(field="curiosity_config.min_pressure", type=float, default=0.1, range=(0.0, 1.0)),
-            "max_pressure": ConfigSchema(field="curiosity_config.max_pressure", type=float, default=0.9, range=(0.0, 1.0)),
-            "pressure_decay_rate": ConfigSchema(field="curiosity_config.pressure_decay_rate", type=float, default=0.95, range=(0.0, 1.0)),
-            "metrics_maxlen": ConfigSchema(field="curiosity_config.metrics_maxlen", type=int, default=20, range=(1, None)),
+            "min_pressure": _prob("curiosity_config.min_pressure", 0.1),
+            "max_pressure": _prob("curiosity_config.max_pressure", 0.9),
+            "pressure_decay_rate": _prob("curiosity_config.pressure_decay_rate", 0.95),
+            "metrics_maxlen": _pos_int("curiosity_config.metrics_maxlen", 20),
             "min_temperature": ConfigSchema(field="curiosity_config.min_temperature", type=float, default=0.7, range=(0.0, None)),
             "max_temperature": ConfigSchema(field="curiosity_config.max_temperature", type=float, default=1.7, range=(0.0, None)),
             "lifecycle_params": ConfigSchema(field="curiosity_config.lifecycle_params", type=dict, default={
@@ -346,7 +383,7 @@ class ValidationSchema:
     def _get_cross_attn_config_schema() -> Dict[str, ConfigSchema]:
         """Return the cross_attn_config schema."""
         return {
-            "memory_weight": ConfigSchema(field="cross_attn_config.memory_weight", type=float, default=0.2, range=(0.0, 1.0)),
+            "memory_weight": _prob("cross_attn_config.memory_weight", 0.2),
         }
 
     @staticmethod
@@ -355,33 +392,19 @@ class ValidationSchema:
         return {
             "log_dir": ConfigSchema(field="logging_config.log_dir", type=str, default="logs"),
             "log_file": ConfigSchema(field="logging_config.log_file", type=str, default="sovl_logs.jsonl"),
-            "log_level": ConfigSchema(field="logging_config.log_level", type=str, default="INFO", validator=lambda x: x in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
-            "max_log_size_mb": ConfigSchema(field="logging_config.max_log_size_mb", type=int, default=10, range=(1, None)),
+            "log_level": ConfigSchema(field="logging_config.log_level", type=str, default="INFO", validator=_in(_LOG_LEVELS)),
+            "max_log_size_mb": _pos_int("logging_config.max_log_size_mb", 10),
             "backup_count": ConfigSchema(field="logging_config.backup_count", type=int, default=5, range=(0, None)),
+            "logging_enabled": ConfigSchema(field="logging_config.logging_enabled", type=bool, default=True),
         }
     
     @staticmethod
     def _get_token_mapping_config_schema() -> Dict[str, ConfigSchema]:
         """Return the token_mapping config schema."""
         return {
-            "min_token_map_confidence": ConfigSchema(
-                field="token_mapping.min_token_map_confidence",
-                type=float,
-                default=0.5,
-                range=(0.0, 1.0)
-            ),
-            "max_low_conf_ratio": ConfigSchema(
-                field="token_mapping.max_low_conf_ratio",
-                type=float,
-                default=0.2,
-                range=(0.0, 1.0)
-            ),
-            "max_fallback_ratio": ConfigSchema(
-                field="token_mapping.max_fallback_ratio",
-                type=float,
-                default=0.3,
-                range=(0.0, 1.0)
-            ),
+            "min_token_map_confidence": _prob("token_mapping.min_token_map_confidence", 0.5),
+            "max_low_conf_ratio": _prob("token_mapping.max_low_conf_ratio", 0.2),
+            "max_fallback_ratio": _prob("token_mapping.max_fallback_ratio", 0.3),
             "token_mapping_fallback_order": ConfigSchema(
                 field="token_mapping.token_mapping_fallback_order",
                 type=list,
@@ -404,14 +427,14 @@ class ValidationSchema:
         """Return the generation_config schema."""
         return {
             "temperature": ConfigSchema(field="generation_config.temperature", type=float, default=0.7, range=(0.0, None)),
-            "top_p": ConfigSchema(field="generation_config.top_p", type=float, default=0.9, range=(0.0, 1.0)),
+            "top_p": _prob("generation_config.top_p", 0.9),
         }
 
     @staticmethod
     def _get_data_config_schema() -> Dict[str, ConfigSchema]:
         """Return the data_config schema."""
         return {
-            "batch_size": ConfigSchema(field="data_config.batch_size", type=int, default=2, range=(1, None)),
+            "batch_size": _pos_int("data_config.batch_size", 2),
             "max_retries": ConfigSchema(field="data_config.max_retries", type=int, default=3, range=(0, None)),
         }
 
@@ -420,7 +443,7 @@ class ValidationSchema:
         """Return the data_provider schema."""
         return {
             "provider_type": ConfigSchema(field="data_provider.provider_type", type=str, default="default"),
-            "data_path": ConfigSchema(field="data_provider.data_path", type=str, required=True),
+            "data_path": _req_str("data_provider.data_path"),
         }
     
     @staticmethod
@@ -472,39 +495,37 @@ class ValidationSchema:
         }
 
     @staticmethod
-    def _get_memory_config_schema() -> Dict[str, Dict[str, ConfigSchema]]:
+    def _get_memory_config_schema() -> Dict[str, ConfigSchema]:
         """Return the memory_config schema."""
         return {
-            "memoria": {
-                "max_memory_mb": ConfigSchema(field="memory_config.memoria.max_memory_mb", type=int, default=512, range=(1, None)),
-                "garbage_collection_threshold": ConfigSchema(field="memory_config.memoria.garbage_collection_threshold", type=float, default=0.7, range=(0.0, 1.0)),
-                "memory_decay_rate": ConfigSchema(field="memory_config.memoria.memory_decay_rate", type=float, default=0.95, range=(0.0, 1.0)),
-                "enable_memory_compression": ConfigSchema(field="memory_config.memoria.enable_memory_compression", type=bool, default=True),
-                "compression_ratio": ConfigSchema(field="memory_config.memoria.compression_ratio", type=float, default=0.5, range=(0.0, 1.0)),
-                "max_compressed_memory_mb": ConfigSchema(field="memory_config.memoria.max_compressed_memory_mb", type=int, default=1024, range=(1, None)),
-            },
-            "ram": {
-                "max_ram_mb": ConfigSchema(field="memory_config.ram.max_ram_mb", type=int, default=2048, range=(1, None)),
-                "ram_threshold": ConfigSchema(field="memory_config.ram.ram_threshold", type=float, default=0.8, range=(0.0, 1.0)),
-                "enable_ram_compression": ConfigSchema(field="memory_config.ram.enable_ram_compression", type=bool, default=True),
-                "ram_compression_ratio": ConfigSchema(field="memory_config.ram.ram_compression_ratio", type=float, default=0.6, range=(0.0, 1.0)),
-                "max_compressed_ram_mb": ConfigSchema(field="memory_config.ram.max_compressed_ram_mb", type=int, default=4096, range=(1, None)),
-            },
-            "gpu": {
-                "max_gpu_memory_mb": ConfigSchema(field="memory_config.gpu.max_gpu_memory_mb", type=int, default=1024, range=(1, None)),
-                "gpu_memory_threshold": ConfigSchema(field="memory_config.gpu.gpu_memory_threshold", type=float, default=0.85, range=(0.0, 1.0)),
-                "enable_gpu_memory_compression": ConfigSchema(field="memory_config.gpu.enable_gpu_memory_compression", type=bool, default=True),
-                "gpu_compression_ratio": ConfigSchema(field="memory_config.gpu.gpu_compression_ratio", type=float, default=0.7, range=(0.0, 1.0)),
-                "max_compressed_gpu_memory_mb": ConfigSchema(field="memory_config.gpu.max_compressed_gpu_memory_mb", type=int, default=2048, range=(1, None)),
-            },
-            "manager": {
-                "enable_memoria_manager": ConfigSchema(field="memory_config.manager.enable_memoria_manager", type=bool, default=True),
-                "enable_ram_manager": ConfigSchema(field="memory_config.manager.enable_ram_manager", type=bool, default=True),
-                "enable_gpu_memory_manager": ConfigSchema(field="memory_config.manager.enable_gpu_memory_manager", type=bool, default=True),
-                "memory_sync_interval": ConfigSchema(field="memory_config.manager.memory_sync_interval", type=int, default=60, range=(1, None)),
-                "enable_memory_monitoring": ConfigSchema(field="memory_config.manager.enable_memory_monitoring", type=bool, default=True),
-                "memory_monitoring_interval": ConfigSchema(field="memory_config.manager.memory_monitoring_interval", type=int, default=5, range=(1, None)),
-            },
+            "faiss_rebuild_threshold": ConfigSchema(
+                field="memory_config.faiss_rebuild_threshold",
+                type=int,
+                default=100,
+                description="Number of new/changed records before the FAISS index is rebuilt. Increase for less frequent rebuilds on low-power systems."
+            ),
+            "memoria.max_memory_mb": _pos_int("memory_config.memoria.max_memory_mb", 512),
+            "memoria.garbage_collection_threshold": _prob("memory_config.memoria.garbage_collection_threshold", 0.7),
+            "memoria.memory_decay_rate": _prob("memory_config.memoria.memory_decay_rate", 0.95),
+            "memoria.enable_memory_compression": ConfigSchema(field="memory_config.memoria.enable_memory_compression", type=bool, default=True),
+            "memoria.compression_ratio": _prob("memory_config.memoria.compression_ratio", 0.5),
+            "memoria.max_compressed_memory_mb": _pos_int("memory_config.memoria.max_compressed_memory_mb", 1024),
+            "ram.max_ram_mb": _pos_int("memory_config.ram.max_ram_mb", 2048),
+            "ram.ram_threshold": _prob("memory_config.ram.ram_threshold", 0.8),
+            "ram.enable_ram_compression": ConfigSchema(field="memory_config.ram.enable_ram_compression", type=bool, default=True),
+            "ram.ram_compression_ratio": _prob("memory_config.ram.ram_compression_ratio", 0.6),
+            "ram.max_compressed_ram_mb": _pos_int("memory_config.ram.max_compressed_ram_mb", 4096),
+            "gpu.max_gpu_memory_mb": _pos_int("memory_config.gpu.max_gpu_memory_mb", 1024),
+            "gpu.gpu_memory_threshold": _prob("memory_config.gpu.gpu_memory_threshold", 0.85),
+            "gpu.enable_gpu_memory_compression": ConfigSchema(field="memory_config.gpu.enable_gpu_memory_compression", type=bool, default=True),
+            "gpu.gpu_compression_ratio": _prob("memory_config.gpu.gpu_compression_ratio", 0.7),
+            "gpu.max_compressed_gpu_memory_mb": _pos_int("memory_config.gpu.max_compressed_gpu_memory_mb", 2048),
+            "manager.enable_memoria_manager": ConfigSchema(field="memory_config.manager.enable_memoria_manager", type=bool, default=True),
+            "manager.enable_ram_manager": ConfigSchema(field="memory_config.manager.enable_ram_manager", type=bool, default=True),
+            "manager.enable_gpu_memory_manager": ConfigSchema(field="memory_config.manager.enable_gpu_memory_manager", type=bool, default=True),
+            "manager.memory_sync_interval": _pos_int("memory_config.manager.memory_sync_interval", 60),
+            "manager.enable_memory_monitoring": ConfigSchema(field="memory_config.manager.enable_memory_monitoring", type=bool, default=True),
+            "manager.memory_monitoring_interval": _pos_int("memory_config.manager.memory_monitoring_interval", 5),
         }
     
     @staticmethod
@@ -530,10 +551,8 @@ class ValidationSchema:
     def _get_training_config_schema() -> Dict[str, ConfigSchema]:
         """Return the training_config schema."""
         return {
-            "batch_size": ConfigSchema(
-                field="training_config.batch_size",
-                type=int,
-                default=1,
+            "batch_size": _pos_int(
+                "training_config.batch_size", 1,
                 description="Batch size for training. Lower for low-power systems."
             ),
             "use_amp": ConfigSchema(
@@ -542,28 +561,20 @@ class ValidationSchema:
                 default=False,
                 description="Use automatic mixed precision (AMP). Set False for CPUs or older GPUs."
             ),
-            "checkpoint_interval": ConfigSchema(
-                field="training_config.checkpoint_interval",
-                type=int,
-                default=5000,
+            "checkpoint_interval": _pos_int(
+                "training_config.checkpoint_interval", 5000,
                 description="Steps between checkpoints. Increase for less disk I/O on low-power systems."
             ),
-            "validate_every_n_steps": ConfigSchema(
-                field="training_config.validate_every_n_steps",
-                type=int,
-                default=500,
+            "validate_every_n_steps": _pos_int(
+                "training_config.validate_every_n_steps", 500,
                 description="Steps between validation runs. Increase for less CPU usage."
             ),
-            "max_in_memory_logs": ConfigSchema(
-                field="training_config.max_in_memory_logs",
-                type=int,
-                default=100,
+            "max_in_memory_logs": _pos_int(
+                "training_config.max_in_memory_logs", 100,
                 description="Maximum number of training logs to keep in memory."
             ),
-            "prune_interval_hours": ConfigSchema(
-                field="training_config.prune_interval_hours",
-                type=int,
-                default=48,
+            "prune_interval_hours": _pos_int(
+                "training_config.prune_interval_hours", 48,
                 description="How often (in hours) to prune old logs."
             ),
             "logging_verbosity": ConfigSchema(
@@ -590,69 +601,15 @@ class ValidationSchema:
                 default=16,
                 range=(1, 256)
             ),
-            "lora_dropout": ConfigSchema(
-                field="engram_lora.lora_dropout",
-                type=float,
-                default=0.1,
-                range=(0.0, 1.0)
-            ),
+            "lora_dropout": _prob("engram_lora.lora_dropout", 0.1),
             # Optionally, add more LoRA-related parameters here
         }
     
-    @staticmethod
-    def _get_scribed_config_schema() -> Dict[str, ConfigSchema]:
-        """Return the scribed_config schema."""
-        return {
-            "output_path": ConfigSchema(
-                field="scribed_config.output_path",
-                type=str,
-                default="scribe/sovl_scribe.jsonl"
-            ),
-            "scribe_batch_size": ConfigSchema(
-                field="scribed_config.scribe_batch_size",
-                type=int,
-                default=20
-            ),
-            "scribe_flush_interval": ConfigSchema(
-                field="scribed_config.scribe_flush_interval",
-                type=float,
-                default=2.0
-            ),
-            "scribe_queue_maxsize": ConfigSchema(
-                field="scribed_config.scribe_queue_maxsize",
-                type=int,
-                default=2000
-            ),
-        }
-    
-    @staticmethod
-    def _get_memory_config_schema() -> Dict[str, ConfigSchema]:
-        """Return the memory_config schema."""
-        return {
-            "faiss_rebuild_threshold": ConfigSchema(
-                field="memory_config.faiss_rebuild_threshold",
-                type=int,
-                default=100,
-                description="Number of new/changed records before the FAISS index is rebuilt. Increase for less frequent rebuilds on low-power systems."
-            ),
-        }
-    
-    @staticmethod
-    def _get_logging_config_schema() -> Dict[str, ConfigSchema]:
-        """Return the logging_config schema."""
-        return {
-            "logging_enabled": ConfigSchema(
-                field="logging_config.logging_enabled",
-                type=bool,
-                default=True
-            ),
-        }
-
     @staticmethod
     def _get_state_config_schema() -> Dict[str, ConfigSchema]:
         """Return the state_config schema."""
         return {
-            "max_history": ConfigSchema(field="state_config.max_history", type=int, default=100, range=(1, None)),
+            "max_history": _pos_int("state_config.max_history", 100),
             "state_file": ConfigSchema(field="state_config.state_file", type=str, default="sovl_state.json"),
         }
 
@@ -660,20 +617,15 @@ class ValidationSchema:
     def _get_confidence_config_schema() -> Dict[str, ConfigSchema]:
         """Return the confidence_config schema."""
         return {
-            "history_maxlen": ConfigSchema(field="confidence_config.history_maxlen", type=int, default=5, range=(1, None)),
-            "weight": ConfigSchema(field="confidence_config.weight", type=float, default=0.5, range=(0.0, 1.0)),
+            "history_maxlen": _pos_int("confidence_config.history_maxlen", 5),
+            "weight": _prob("confidence_config.weight", 0.5),
         }
 
     @staticmethod
     def _get_gestation_config_schema() -> Dict[str, ConfigSchema]:
         """Return the gestation_config schema (tiredness/sleep/gestation parameters)."""
         return {
-            "tiredness_threshold": ConfigSchema(
-                field="gestation_config.tiredness_threshold",
-                type=float,
-                default=0.7,
-                range=(0.0, 1.0)
-            ),
+            "tiredness_threshold": _prob("gestation_config.tiredness_threshold", 0.7),
             "tiredness_check_interval": ConfigSchema(
                 field="gestation_config.tiredness_check_interval",
                 type=int,
@@ -702,7 +654,7 @@ class ValidationSchema:
                 field="gestation_config.tiredness_weights",
                 type=dict,
                 default={"log": 0.4, "confidence": 0.3, "time": 0.3},
-                validator=lambda x: all(k in x for k in ["log", "confidence", "time"])
+                validator=_TIREDNESS_WEIGHT_KEYS.issubset
             ),
             "min_awake_seconds": ConfigSchema(
                 field="gestation_config.min_awake_seconds",
@@ -913,55 +865,56 @@ class ValidationSchema:
                         "min": {"type": "number", "minimum": 0.1, "default": 0.1},
                         "max": {"type": "number", "minimum": 0.1, "default": 3.0}
                     }
-                },
-
-                "experience_memory": {
-                    "max_short_term": ConfigSchema(
-                        field="experience_memory.max_short_term",
-                        type=int,
-                        default=50,
-                        range=(1, 1000),
-                        required=False
-                    ),
-                    "short_term_expiry_seconds": ConfigSchema(
-                        field="experience_memory.short_term_expiry_seconds",
-                        type=int,
-                        default=3600,
-                        range=(1, None),
-                        required=False
-                    ),
-                    "embedding_dim": ConfigSchema(
-                        field="experience_memory.embedding_dim",
-                        type=int,
-                        default=128,
-                        range=(1, None),
-                        required=False
-                    ),
-                    "long_term_top_k": ConfigSchema(
-                        field="experience_memory.long_term_top_k",
-                        type=int,
-                        default=5,
-                        range=(1, 100),
-                        required=False
-                    ),
-                    "long_term_retention_days": ConfigSchema(
-                        field="experience_memory.long_term_retention_days",
-                        type=int,
-                        default=30,
-                        range=(1, 3650),
-                        required=False
-                    ),
-                    "memory_logging_level": ConfigSchema(
-                        field="experience_memory.memory_logging_level",
-                        type=str,
-                        default="info",
-                        validator=lambda x: x in ["debug", "info", "warning", "error", "critical"],
-                        required=False
-                    ),
-                },
-
+                }
             }
-    
+        }
+
+    @staticmethod
+    def _get_experience_memory_schema() -> Dict[str, ConfigSchema]:
+        """Return the experience_memory schema."""
+        return {
+            "max_short_term": ConfigSchema(
+                field="experience_memory.max_short_term",
+                type=int,
+                default=50,
+                range=(1, 1000),
+                required=False
+            ),
+            "short_term_expiry_seconds": ConfigSchema(
+                field="experience_memory.short_term_expiry_seconds",
+                type=int,
+                default=3600,
+                range=(1, None),
+                required=False
+            ),
+            "embedding_dim": ConfigSchema(
+                field="experience_memory.embedding_dim",
+                type=int,
+                default=128,
+                range=(1, None),
+                required=False
+            ),
+            "long_term_top_k": ConfigSchema(
+                field="experience_memory.long_term_top_k",
+                type=int,
+                default=5,
+                range=(1, 100),
+                required=False
+            ),
+            "long_term_retention_days": ConfigSchema(
+                field="experience_memory.long_term_retention_days",
+                type=int,
+                default=30,
+                range=(1, 3650),
+                required=False
+            ),
+            "memory_logging_level": ConfigSchema(
+                field="experience_memory.memory_logging_level",
+                type=str,
+                default="info",
+                validator=_in(_MEMORY_LOG_LEVELS),
+                required=False
+            ),
         }
 
     @staticmethod
@@ -980,8 +933,8 @@ class ValidationSchema:
         """Return the scribed_config schema."""
         return {
             "output_path": ConfigSchema(field="scribed_config.output_path", type=str, default="scribe/sovl_scribe.jsonl"),
-            "max_file_size_mb": ConfigSchema(field="scribed_config.max_file_size_mb", type=int, default=50, range=(1, None)),
-            "buffer_size": ConfigSchema(field="scribed_config.buffer_size", type=int, default=10, range=(1, None)),
+            "max_file_size_mb": _pos_int("scribed_config.max_file_size_mb", 50),
+            "buffer_size": _pos_int("scribed_config.buffer_size", 10),
         }
 
     @staticmethod
@@ -993,14 +946,14 @@ class ValidationSchema:
                 type=dict,
                 default={"prompt": "prompt", "completion": "completion"},
                 required=False,
-                validator=lambda v: isinstance(v, dict) and all(isinstance(k, str) and isinstance(val, str) for k, val in v.items())
+                validator=_str_to_str_map
             ),
             "required_fields": ConfigSchema(
                 field="io_config.required_fields",
                 type=list,
                 default=["prompt", "completion"],
                 required=False,
-                validator=lambda v: isinstance(v, list) and all(isinstance(i, str) for i in v)
+                validator=_all_str
             ),
             "min_string_length": ConfigSchema(
                 field="io_config.min_string_length",
@@ -1047,204 +1000,109 @@ class ValidationSchema:
     def _get_metrics_config_schema() -> Dict[str, ConfigSchema]:
         """Return the metrics_config schema."""
         return {
-            "token_statistics": {
-                "enabled": ConfigSchema(
-                    field="metrics_config.token_statistics.enabled",
-                    type=bool,
-                    default=True
-                ),
-                "ngram_sizes": ConfigSchema(
-                    field="metrics_config.token_statistics.ngram_sizes",
-                    type=list,
-                    default=[2, 3, 4],
-                    validator=lambda x: all(isinstance(n, int) and n > 0 for n in x)
-                ),
-                "special_token_tracking": ConfigSchema(
-                    field="metrics_config.token_statistics.special_token_tracking",
-                    type=bool,
-                    default=True
-                ),
-                "min_token_frequency": ConfigSchema(
-                    field="metrics_config.token_statistics.min_token_frequency",
-                    type=int,
-                    default=2,
-                    range=(1, None)
-                ),
-                "max_tokens_to_track": ConfigSchema(
-                    field="metrics_config.token_statistics.max_tokens_to_track",
-                    type=int,
-                    default=1000,
-                    range=(1, None)
-                ),
-                "token_pattern_threshold": ConfigSchema(
-                    field="metrics_config.token_statistics.token_pattern_threshold",
-                    type=float,
-                    default=0.1,
-                    range=(0.0, 1.0)
-                )
-            },
-            "performance_metrics": {
-                "enabled": ConfigSchema(
-                    field="metrics_config.performance_metrics.enabled",
-                    type=bool,
-                    default=True
-                ),
-                "track_generation_time": ConfigSchema(
-                    field="metrics_config.performance_metrics.track_generation_time",
-                    type=bool,
-                    default=True
-                ),
-                "track_memory_usage": ConfigSchema(
-                    field="metrics_config.performance_metrics.track_memory_usage",
-                    type=bool,
-                    default=True
-                ),
-                "track_efficiency": ConfigSchema(
-                    field="metrics_config.performance_metrics.track_efficiency",
-                    type=bool,
-                    default=True
-                ),
-                "memory_sample_rate": ConfigSchema(
-                    field="metrics_config.performance_metrics.memory_sample_rate",
-                    type=int,
-                    default=1000,
-                    range=(100, None)
-                ),
-                "time_window_ms": ConfigSchema(
-                    field="metrics_config.performance_metrics.time_window_ms",
-                    type=int,
-                    default=5000,
-                    range=(1000, None)
-                )
-            },
-            "structure_analysis": {
-                "enabled": ConfigSchema(
-                    field="metrics_config.structure_analysis.enabled",
-                    type=bool,
-                    default=True
-                ),
-                "track_length_metrics": ConfigSchema(
-                    field="metrics_config.structure_analysis.track_length_metrics",
-                    type=bool,
-                    default=True
-                ),
-                "track_whitespace": ConfigSchema(
-                    field="metrics_config.structure_analysis.track_whitespace",
-                    type=bool,
-                    default=True
-                ),
-                "min_section_length": ConfigSchema(
-                    field="metrics_config.structure_analysis.min_section_length",
-                    type=int,
-                    default=10,
-                    range=(1, None)
-                ),
-                "max_section_length": ConfigSchema(
-                    field="metrics_config.structure_analysis.max_section_length",
-                    type=int,
-                    default=1000,
-                    range=(1, None)
-                ),
-                "whitespace_ratio_threshold": ConfigSchema(
-                    field="metrics_config.structure_analysis.whitespace_ratio_threshold",
-                    type=float,
-                    default=0.3,
-                    range=(0.0, 1.0)
-                )
-            },
-            "relationship_context": {
-                "enabled": ConfigSchema(
-                    field="metrics_config.relationship_context.enabled",
-                    type=bool,
-                    default=True
-                ),
-                "max_context_history": ConfigSchema(
-                    field="metrics_config.relationship_context.max_context_history",
-                    type=int,
-                    default=100,
-                    range=(1, None)
-                ),
-                "reference_decay_rate": ConfigSchema(
-                    field="metrics_config.relationship_context.reference_decay_rate",
-                    type=float,
-                    default=0.95,
-                    range=(0.0, 1.0)
-                ),
-                "temporal_window_size": ConfigSchema(
-                    field="metrics_config.relationship_context.temporal_window_size",
-                    type=int,
-                    default=10,
-                    range=(1, None)
-                ),
-                "min_relationship_strength": ConfigSchema(
-                    field="metrics_config.relationship_context.min_relationship_strength",
-                    type=float,
-                    default=0.1,
-                    range=(0.0, 1.0)
-                )
-            },
-            "helper_methods": {
-                "indentation_analysis": {
-                    "enabled": ConfigSchema(
-                        field="metrics_config.helper_methods.indentation_analysis.enabled",
-                        type=bool,
-                        default=True
-                    ),
-                    "max_indent_level": ConfigSchema(
-                        field="metrics_config.helper_methods.indentation_analysis.max_indent_level",
-                        type=int,
-                        default=8,
-                        range=(1, None)
-                    ),
-                    "tab_size": ConfigSchema(
-                        field="metrics_config.helper_methods.indentation_analysis.tab_size",
-                        type=int,
-                        default=4,
-                        range=(1, None)
-                    ),
-                    "mixed_indent_warning": ConfigSchema(
-                        field="metrics_config.helper_methods.indentation_analysis.mixed_indent_warning",
-                        type=bool,
-                        default=True
-                    )
-                },
-                "optimization_analysis": {
-                    "enabled": ConfigSchema(
-                        field="metrics_config.helper_methods.optimization_analysis.enabled",
-                        type=bool,
-                        default=True
-                    ),
-                    "performance_threshold": ConfigSchema(
-                        field="metrics_config.helper_methods.optimization_analysis.performance_threshold",
-                        type=float,
-                        default=0.8,
-                        range=(0.0, 1.0)
-                    ),
-                    "memory_threshold": ConfigSchema(
-                        field="metrics_config.helper_methods.optimization_analysis.memory_threshold",
-                        type=float,
-                        default=0.9,
-                        range=(0.0, 1.0)
-                    ),
-                    "optimization_levels": ConfigSchema(
-                        field="metrics_config.helper_methods.optimization_analysis.optimization_levels",
-                        type=list,
-                        default=["basic", "moderate", "aggressive"],
-                        validator=lambda x: all(isinstance(level, str) and level in ["basic", "moderate", "aggressive"] for level in x)
-                    )
-                }
-            }
-        }
-
-    @staticmethod
-    def _get_dreamer_config_schema() -> Dict[str, ConfigSchema]:
-        """Return the dreamer_config schema for the Dreamer class."""
-        return {
-            "dream_max_events_per_cycle": ConfigSchema(field="dreamer_config.dream_max_events_per_cycle", type=int, default=5, range=(1, 100)),
-            "dream_novelty_weight": ConfigSchema(field="dreamer_config.dream_novelty_weight", type=float, default=1.0, range=(0.0, 10.0)),
-            "dream_confidence_weight": ConfigSchema(field="dreamer_config.dream_confidence_weight", type=float, default=0.0, range=(0.0, 10.0)),
-            "dream_selection_strategy": ConfigSchema(field="dreamer_config.dream_selection_strategy", type=str, default="top", validator=lambda x: x in ["top", "random"]),
-            "dream_noise_level": ConfigSchema(field="dreamer_config.dream_noise_level", type=float, default=0.2, range=(0.0, 1.0)),
+            "token_statistics.enabled": ConfigSchema(
+                field="metrics_config.token_statistics.enabled",
+                type=bool,
+                default=True
+            ),
+            "token_statistics.ngram_sizes": ConfigSchema(
+                field="metrics_config.token_statistics.ngram_sizes",
+                type=list,
+                default=[2, 3, 4],
+                validator=_positive_ints
+            ),
+            "token_statistics.special_token_tracking": ConfigSchema(
+                field="metrics_config.token_statistics.special_token_tracking",
+                type=bool,
+                default=True
+            ),
+            "token_statistics.min_token_frequency": _pos_int("metrics_config.token_statistics.min_token_frequency", 2),
+            "token_statistics.max_tokens_to_track": _pos_int("metrics_config.token_statistics.max_tokens_to_track", 1000),
+            "token_statistics.token_pattern_threshold": _prob("metrics_config.token_statistics.token_pattern_threshold", 0.1),
+            "performance_metrics.enabled": ConfigSchema(
+                field="metrics_config.performance_metrics.enabled",
+                type=bool,
+                default=True
+            ),
+            "performance_metrics.track_generation_time": ConfigSchema(
+                field="metrics_config.performance_metrics.track_generation_time",
+                type=bool,
+                default=True
+            ),
+            "performance_metrics.track_memory_usage": ConfigSchema(
+                field="metrics_config.performance_metrics.track_memory_usage",
+                type=bool,
+                default=True
+            ),
+            "performance_metrics.track_efficiency": ConfigSchema(
+                field="metrics_config.performance_metrics.track_efficiency",
+                type=bool,
+                default=True
+            ),
+            "performance_metrics.memory_sample_rate": ConfigSchema(
+                field="metrics_config.performance_metrics.memory_sample_rate",
+                type=int,
+                default=1000,
+                range=(100, None)
+            ),
+            "performance_metrics.time_window_ms": ConfigSchema(
+                field="metrics_config.performance_metrics.time_window_ms",
+                type=int,
+                default=5000,
+                range=(1000, None)
+            ),
+            "structure_analysis.enabled": ConfigSchema(
+                field="metrics_config.structure_analysis.enabled",
+                type=bool,
+                default=True
+            ),
+            "structure_analysis.track_length_metrics": ConfigSchema(
+                field="metrics_config.structure_analysis.track_length_metrics",
+                type=bool,
+                default=True
+            ),
+            "structure_analysis.track_whitespace": ConfigSchema(
+                field="metrics_config.structure_analysis.track_whitespace",
+                type=bool,
+                default=True
+            ),
+            "structure_analysis.min_section_length": _pos_int("metrics_config.structure_analysis.min_section_length", 10),
+            "structure_analysis.max_section_length": _pos_int("metrics_config.structure_analysis.max_section_length", 1000),
+            "structure_analysis.whitespace_ratio_threshold": _prob("metrics_config.structure_analysis.whitespace_ratio_threshold", 0.3),
+            "relationship_context.enabled": ConfigSchema(
+                field="metrics_config.relationship_context.enabled",
+                type=bool,
+                default=True
+            ),
+            "relationship_context.max_context_history": _pos_int("metrics_config.relationship_context.max_context_history", 100),
+            "relationship_context.reference_decay_rate": _prob("metrics_config.relationship_context.reference_decay_rate", 0.95),
+            "relationship_context.temporal_window_size": _pos_int("metrics_config.relationship_context.temporal_window_size", 10),
+            "relationship_context.min_relationship_strength": _prob("metrics_config.relationship_context.min_relationship_strength", 0.1),
+            "helper_methods.indentation_analysis.enabled": ConfigSchema(
+                field="metrics_config.helper_methods.indentation_analysis.enabled",
+                type=bool,
+                default=True
+            ),
+            "helper_methods.indentation_analysis.max_indent_level": _pos_int("metrics_config.helper_methods.indentation_analysis.max_indent_level", 8),
+            "helper_methods.indentation_analysis.tab_size": _pos_int("metrics_config.helper_methods.indentation_analysis.tab_size", 4),
+            "helper_methods.indentation_analysis.mixed_indent_warning": ConfigSchema(
+                field="metrics_config.helper_methods.indentation_analysis.mixed_indent_warning",
+                type=bool,
+                default=True
+            ),
+            "helper_methods.optimization_analysis.enabled": ConfigSchema(
+                field="metrics_config.helper_methods.optimization_analysis.enabled",
+                type=bool,
+                default=True
+            ),
+            "helper_methods.optimization_analysis.performance_threshold": _prob("metrics_config.helper_methods.optimization_analysis.performance_threshold", 0.8),
+            "helper_methods.optimization_analysis.memory_threshold": _prob("metrics_config.helper_methods.optimization_analysis.memory_threshold", 0.9),
+            "helper_methods.optimization_analysis.optimization_levels": ConfigSchema(
+                field="metrics_config.helper_methods.optimization_analysis.optimization_levels",
+                type=list,
+                default=["basic", "moderate", "aggressive"],
+                validator=_subset_of(_OPTIMIZATION_LEVELS)
+            )
         }
 
     @staticmethod
@@ -1263,24 +1121,9 @@ class ValidationSchema:
     def _get_motivator_config_schema() -> Dict[str, ConfigSchema]:
         """Return the motivator_config schema for the Motivator class."""
         return {
-            "decay_rate": ConfigSchema(
-                field="motivator_config.decay_rate",
-                type=float,
-                default=0.01,
-                range=(0.0, 1.0)
-            ),
-            "min_priority": ConfigSchema(
-                field="motivator_config.min_priority",
-                type=float,
-                default=0.1,
-                range=(0.0, 1.0)
-            ),
-            "completion_threshold": ConfigSchema(
-                field="motivator_config.completion_threshold",
-                type=float,
-                default=0.95,
-                range=(0.0, 1.0)
-            ),
+            "decay_rate": _prob("motivator_config.decay_rate", 0.01),
+            "min_priority": _prob("motivator_config.min_priority", 0.1),
+            "completion_threshold": _prob("motivator_config.completion_threshold", 0.95),
             "reevaluation_interval": ConfigSchema(
                 field="motivator_config.reevaluation_interval",
                 type=int,
@@ -1292,24 +1135,9 @@ class ValidationSchema:
                 type=bool,
                 default=True
             ),
-            "irrelevance_threshold": ConfigSchema(
-                field="motivator_config.irrelevance_threshold",
-                type=float,
-                default=0.2,
-                range=(0.0, 1.0)
-            ),
-            "completion_drive": ConfigSchema(
-                field="motivator_config.completion_drive",
-                type=float,
-                default=0.7,
-                range=(0.0, 1.0)
-            ),
-            "novelty_drive": ConfigSchema(
-                field="motivator_config.novelty_drive",
-                type=float,
-                default=0.2,
-                range=(0.0, 1.0)
-            ),
+            "irrelevance_threshold": _prob("motivator_config.irrelevance_threshold", 0.2),
+            "completion_drive": _prob("motivator_config.completion_drive", 0.7),
+            "novelty_drive": _prob("motivator_config.novelty_drive", 0.2),
         }
     
     @staticmethod
@@ -1341,7 +1169,7 @@ class ValidationSchema:
                 field="dreamer_config.selection_strategy",
                 type=str,
                 default="top",
-                validator=lambda x: x in ["top", "random"],
+                validator=_in(_DREAM_SELECTION_STRATEGIES),
                 required=True
             ),
             "noise_level": ConfigSchema(
@@ -1400,6 +1228,36 @@ class ValidationSchema:
             ),
         }
 
+# Section name -> builder, in schema order; a tuple so a repeated section stays visible instead of silently overriding
+_SECTION_BUILDERS = (
+    ("core_config", ValidationSchema._get_core_config_schema),
+    ("model", ValidationSchema._get_model_schema),
+    ("controls_config", ValidationSchema._get_controls_config_schema),
+    ("temperament_config", ValidationSchema._get_temperament_config_schema),
+    ("training_config", ValidationSchema._get_training_config_schema),
+    ("scaffold_config", ValidationSchema._get_scaffold_config_schema),
+    ("dynamic_weighting", ValidationSchema._get_dynamic_weighting_schema),
+    ("curiosity_config", ValidationSchema._get_curiosity_config_schema),
+    ("cross_attn_config", ValidationSchema._get_cross_attn_config_schema),
+    ("logging_config", ValidationSchema._get_logging_config_schema),
+    ("error_config", ValidationSchema._get_error_config_schema),
+    ("generation_config", ValidationSchema._get_generation_config_schema),
+    ("data_config", ValidationSchema._get_data_config_schema),
+    ("data_provider", ValidationSchema._get_data_provider_schema),
+    ("memory_config", ValidationSchema._get_memory_config_schema),
+    ("state_config", ValidationSchema._get_state_config_schema),
+    ("confidence_config", ValidationSchema._get_confidence_config_schema),
+    ("gestation_config", ValidationSchema._get_gestation_config_schema),
+    ("gestation_weighting", ValidationSchema._get_gestation_weighting_schema),
+    ("experience_memory", ValidationSchema._get_experience_memory_schema),
+    ("monitoring", ValidationSchema._get_monitoring_config_schema),
+    ("scribed_config", ValidationSchema._get_scribed_config_schema),
+    ("io_config", ValidationSchema._get_io_config_schema),
+    ("metrics_config", ValidationSchema._get_metrics_config_schema),
+    ("trainer_weighting", ValidationSchema._get_metadata_weighting_schema),
+    ("dreamer_config", ValidationSchema._get_dreamer_config_schema),
+)
+
 METADATA_FIELDS = {
     "Always Present": [
         ("origin", "Source module/component name"),
@@ -1495,25 +1353,33 @@ METADATA_FIELDS = {
 
 # Utility: Get all metadata fields as a flat list
 
+# METADATA_FIELDS is static, so the flattened field names are computed once
+_ALL_METADATA_FIELDS = tuple(field for group in METADATA_FIELDS.values() for field, _ in group)
+
 def get_all_metadata_fields():
-    fields = []
-    for group in METADATA_FIELDS.values():
-        for field, _ in group:
-            fields.append(field)
-    return fields
+    # A fresh list per call, so callers may append to or concatenate with it
+    return list(_ALL_METADATA_FIELDS)
 
 # Utility: Get default weighting dict for all metadata fields
 
-def get_default_trainer_weighting(default_value=0.0):
-    """Return a dict mapping all metadata fields to a default trainer weighting."""
-    return {field: default_value for field in get_all_metadata_fields()}
+@lru_cache(maxsize=8)
+def _cached_default_weighting(default_value):
+    return MappingProxyType(dict.fromkeys(_ALL_METADATA_FIELDS, default_value))
+
+def get_default_trainer_weighting(default_value=0.0, *, read_only=False):
+    """
+    Return a fresh dict mapping all metadata fields to a default trainer weighting.
+    Pass read_only=True to get the shared read-only view cached per default_value instead of a copy.
+    """
+    weighting = _cached_default_weighting(default_value)
+    return weighting if read_only else dict(weighting)
 
 # Optional: Pretty-print the trainer weighting table
 
-def print_trainer_weighting_table(weighting_dict):
-    print(f"{'Field':50} | {'Weight':10}")
-    print("-" * 65)
-    for field, weight in weighting_dict.items():
-        print(f"{field:50} | {weight:10}")
+def print_trainer_weighting_table(weighting_dict, file=None):
+    lines = [f"{'Field':50} | {'Weight':10}", "-" * 65]
+    lines.extend(f"{field:50} | {weight:10}" for field, weight in weighting_dict.items())
+    # One write for the whole table instead of a print per row
+    (file or sys.stdout).write("\n".join(lines) + "\n")
 
     
\ No newline at end of file
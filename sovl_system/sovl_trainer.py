@@ -16,7 +16,7 @@ from sovl_engram import LoraAdapterManager
 from sovl_io import JSONLLoader, StreamingJSONLoader, ScribeJSONLBatchLoader
 import threading
 import gc
-from sovl_utils import validate_metadata_fields, repair_metadata, get_metadata_value, collate_tensor_batch, move_batch_to_device
+from sovl_utils import validate_metadata_fields, repair_metadata, get_metadata_value, move_batch_to_device, make_adamw
 from sovl_dreamer import Dreamer
 
 # TrainingConfig: holds all training-related configuration groups loaded from ConfigManager.
@@ -417,7 +417,7 @@ class TrainingWorkflowManager:
                             gc.collect()
                             torch.cuda.empty_cache()
                             with self._model_lock:
-                                optimizer = torch.optim.AdamW(
+                                optimizer = make_adamw(
                                     lora_manager.lora_parameters(scaffold_model),
                                     lr=self.config.optimizer.learning_rate
                                 )
@@ -626,24 +626,58 @@ class SOVLTrainer:
         trained_memories = set()
         loader = ScribeJSONLBatchLoader(scribe_path, batch_size, default_weight)
         self.model.train()
-        optimizer = torch.optim.AdamW(self.model.parameters(), lr=self.config.optimizer.learning_rate)
+        optimizer = make_adamw(self.model.parameters(), lr=self.config.optimizer.learning_rate)
+        # Accumulate gradients over several micro-batches per optimizer step
+        grad_accum_steps = max(1, int(self.config.optimizer.grad_accum_steps))
+        max_grad_norm = self.config.optimizer.max_grad_norm
+        # Mixed precision: bf16 where supported needs no loss scaling; fp16 falls back to GradScaler
+        device_type = torch.device(self.device).type
+        amp_dtype = None
+        if self.config.memory.use_amp and device_type == "cuda":
+            amp_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        scaler = torch.amp.GradScaler("cuda", enabled=amp_dtype is torch.float16)
+        use_autocast = amp_dtype is not None
+        # Bind per-step lookups once outside the loop
+        model = self.model
+        params = [p for p in model.parameters() if p.requires_grad]
+        prepare_batch = self.batch_preparer.prepare
+        optimizer.zero_grad()
         for epoch in range(epochs):
+            micro_steps = 0
             for batch_texts, batch_weights in loader:
                 # Track all memory strings in this batch
-                for entry in batch_texts:
-                    if 'memory' in entry:
-                        trained_memories.add(entry['memory'])
+                trained_memories.update(entry['memory'] for entry in batch_texts if 'memory' in entry)
                 # Prepare batch for model (assume batch_preparer handles 'memory' field)
-                batch = self.batch_preparer.prepare(batch_texts)
-                batch = move_batch_to_device(batch, self.device)
-                optimizer.zero_grad()
-                outputs = self.model(**batch)
-                loss = outputs.loss if hasattr(outputs, 'loss') else outputs[0]
+                batch = prepare_batch(batch_texts)
+                with torch.autocast(device_type=device_type, dtype=amp_dtype, enabled=use_autocast):
+                    outputs = model(**batch)
+                    loss = outputs.loss if hasattr(outputs, 'loss') else outputs[0]
                 # Apply per-sample weighting if needed (not shown here)
-                loss.backward()
-                optimizer.step()
+                scaler.scale(loss / grad_accum_steps).backward()
+                micro_steps += 1
+                if micro_steps % grad_accum_steps == 0:
+                    self._optimizer_step(optimizer, params, max_grad_norm, scaler)
+            # Flush gradients left over from a partial accumulation window; each micro-batch was divided
+            # by grad_accum_steps, so rescale to average over the micro-batches actually accumulated
+            remainder = micro_steps % grad_accum_steps
+            if remainder:
+                self._optimizer_step(optimizer, params, max_grad_norm, scaler, grad_rescale=grad_accum_steps / remainder)
         return trained_memories
 
+    def _optimizer_step(self, optimizer: torch.optim.Optimizer, params: List[torch.Tensor], max_grad_norm: float, scaler: torch.amp.GradScaler, grad_rescale: float = 1.0) -> None:
+        """Clip accumulated gradients, apply them, and reset for the next window."""
+        # Unscale first so clipping sees true gradient norms (no-op when the scaler is disabled)
+        scaler.unscale_(optimizer)
+        if grad_rescale != 1.0:
+            grads = [p.grad for p in params if p.grad is not None]
+            if grads:
+                torch._foreach_mul_(grads, grad_rescale)
+        # Multi-tensor norm and scale on CUDA (foreach kernels are CUDA-only); the norm stays on device
+        torch.nn.utils.clip_grad_norm_(params, max_grad_norm, foreach=bool(params) and params[0].is_cuda)
+        scaler.step(optimizer)
+        scaler.update()
+        optimizer.zero_grad()
+
 @dataclass
 class InterpretationConfig:
     """Configuration for metadata interpretation rules."""
@@ -1107,26 +1141,43 @@ class TrainingSampleEnricher:
 class BatchPreparer:
     """
     Tokenizes, collates, and moves a batch of samples to the correct device.
-    Uses the tokenizer and batch/tensor helpers.
+    Pads each batch to its own longest sequence rather than the model maximum.
     """
     def __init__(self, tokenizer, device):
         self.tokenizer = tokenizer
         self.device = device
 
     def prepare(self, samples: list) -> dict:
-        # Tokenize and collate samples
-        batch = []
-        for sample in samples:
-            # Assume sample has 'prompt' and 'response' fields
-            encoded = self.tokenizer(
-                sample["prompt"],
-                text_target=sample.get("response"),
-                return_tensors="pt",
-                truncation=True,
-                padding="max_length",
-                max_length=getattr(self.tokenizer, 'model_max_length', 512)
-            )
-            # Flatten batch dimension
-            encoded = {k: v.squeeze(0) if v.dim() == 2 and v.size(0) == 1 else v for k, v in encoded.items()}
-            batch.append(encoded)
-        return collate_tensor_batch(batch, self.device)
+        # Tokenize the whole batch at once, padding only to the longest sequence in it
+        if not samples:
+            return {}
+        prompts = [sample["prompt"] for sample in samples]
+        # Assume sample has 'prompt' and 'response' fields
+        targets = [sample.get("response") for sample in samples]
+        if any(target is None for target in targets):
+            targets = None
+        max_length = getattr(self.tokenizer, 'model_max_length', 512)
+        # Tokenize once without padding, then pad inputs and labels together to the longest of either
+        tokenized = self.tokenizer(prompts, text_target=targets, truncation=True, max_length=max_length)
+        input_ids = tokenized["input_ids"]
+        label_ids = tokenized.get("labels")
+        longest = max(len(ids) for ids in input_ids + (label_ids or []))
+        pad_token_id = self.tokenizer.pad_token_id
+        if pad_token_id is None:
+            pad_token_id = self.tokenizer.eos_token_id or 0
+        left_pad = getattr(self.tokenizer, "padding_side", "right") == "left"
+        encoded = {
+            "input_ids": torch.full((len(samples), longest), pad_token_id, dtype=torch.long),
+            "attention_mask": torch.zeros((len(samples), longest), dtype=torch.long),
+        }
+        if label_ids is not None:
+            # -100 keeps padded label positions out of the loss
+            encoded["labels"] = torch.full((len(samples), longest), -100, dtype=torch.long)
+        for i, ids in enumerate(input_ids):
+            span = slice(longest - len(ids), longest) if left_pad else slice(0, len(ids))
+            encoded["input_ids"][i, span] = torch.tensor(ids, dtype=torch.long)
+            encoded["attention_mask"][i, span] = 1
+        for i, ids in enumerate(label_ids or ()):
+            span = slice(longest - len(ids), longest) if left_pad else slice(0, len(ids))
+            encoded["labels"][i, span] = torch.tensor(ids, dtype=torch.long)
+        return {k: v.to(self.device) for k, v in encoded.items() if isinstance(v, torch.Tensor)}
@@ -677,8 +677,10 @@ def calculate_token_map_confidence(logits, *, source="base", allow_scaffold=Fals
             print(msg)
         raise ValueError(msg)
     import torch
-    probs = torch.nn.functional.softmax(logits, dim=-1)
-    return probs.max(dim=-1).values.mean().item()
+    with torch.no_grad():
+        # log of the max softmax probability, without materializing the full softmax
+        log_max_prob = logits.amax(dim=-1) - torch.logsumexp(logits, dim=-1)
+        return log_max_prob.exp().mean().item()
 
 def check_adaptation_dependencies(
     logger,
@@ -929,6 +931,24 @@ def collate_tensor_batch(batch: list, device: "torch.device") -> dict:
     except Exception as e:
         raise RuntimeError(f"Failed to collate tensor batch: {e}")
 
+def make_adamw(params, **kwargs) -> torch.optim.AdamW:
+    """
+    Build an AdamW optimizer using the fused (single-kernel) update when every parameter is on CUDA.
+    Falls back to the multi-tensor foreach implementation on older PyTorch or unsupported dtypes.
+    Args:
+        params: Iterable of parameters
+        **kwargs: Extra AdamW arguments (lr, weight_decay, ...)
+    Returns:
+        torch.optim.AdamW
+    """
+    params = list(params)
+    if params and all(isinstance(p, torch.Tensor) and p.is_cuda for p in params):
+        try:
+            return torch.optim.AdamW(params, fused=True, **kwargs)
+        except (TypeError, RuntimeError):
+            pass
+    return torch.optim.AdamW(params, foreach=True, **kwargs)
+
 # --- CLI Feedback and Formatting Utilities ---
 def format_file_size(num_bytes: int) -> str:
     """Return human-readable file size (e.g., 1.2 MB)."""
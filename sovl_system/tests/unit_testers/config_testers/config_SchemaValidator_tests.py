@@ -1,3 +1,6 @@
+from sovl_config import ConfigSchema, SchemaValidator
+from sovl_schema import ValidationSchema, _SECTION_BUILDERS
+
 def test_schema_validator_register(mock_logger):
     """Test that schemas are properly registered and stored"""
     validator = SchemaValidator(mock_logger)
@@ -56,3 +59,14 @@ def test_schema_validator_validation_failures(mock_logger):
     # Non-nullable field with None
     valid, value = validator.validate("test.nullable_field", None)
     assert not valid
+
+def test_validation_schema_sections():
+    """Test that each schema section appears once and the built schema is shared"""
+    section_names = [name for name, _ in _SECTION_BUILDERS]
+    assert section_names.count("gestation_weighting") == 1
+    assert section_names.count("trainer_weighting") == 1
+    assert len(section_names) == len(set(section_names))
+    schema = ValidationSchema.get_schema()
+    assert list(schema) == section_names
+    assert "gestation_weighting" in schema
+    assert ValidationSchema.get_schema() is schema
@@ -0,0 +1,82 @@
+import threading
+import pytest
+
+torch = pytest.importorskip("torch")
+bnb = pytest.importorskip("bitsandbytes")
+from torch import nn
+from sovl_manager import ModelManager
+
+pytestmark = pytest.mark.skipif(not torch.cuda.is_available(), reason="bitsandbytes quantization needs CUDA")
+
+
+class _Attention(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.q_proj = nn.Linear(64, 64, bias=False)
+        self.o_proj = nn.Linear(64, 64, bias=True)
+        self.norm = nn.LayerNorm(64)
+
+
+class _LoraWrapped(nn.Module):
+    """Mimics PEFT's lora.Linear, which keeps the frozen projection at .base_layer"""
+    def __init__(self):
+        super().__init__()
+        self.base_layer = nn.Linear(64, 64, bias=False)
+        self.lora_A = nn.ModuleDict()
+
+
+class _Model(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.self_attn = _Attention()
+        self.mlp = nn.Module()
+        self.mlp.up_proj = _LoraWrapped()
+
+
+@pytest.fixture
+def manager():
+    manager = ModelManager.__new__(ModelManager)
+    manager._device = torch.device("cuda")
+    manager._gpu_lock = threading.Lock()
+    manager._cache_dirty = False
+    return manager
+
+
+@pytest.fixture
+def model():
+    return _Model().half().cuda()
+
+
+def test_requantized_copy_int8(manager, model):
+    """Projections (including PEFT base layers) end up as int8 with quantization stats"""
+    quantized = manager._requantized_copy(model, "int8")
+    for layer in (quantized.self_attn.q_proj, quantized.self_attn.o_proj, quantized.mlp.up_proj.base_layer):
+        assert isinstance(layer, bnb.nn.Linear8bitLt)
+        assert layer.weight.dtype == torch.int8
+        assert layer.weight.CB is not None and layer.weight.SCB is not None
+        assert layer.weight.is_cuda
+    assert quantized.self_attn.norm is model.self_attn.norm
+    assert isinstance(quantized.mlp.up_proj, _LoraWrapped)
+    assert manager._cache_dirty
+
+
+def test_requantized_copy_int4(manager, model):
+    """int4 layers hold packed nf4 data and a quant_state"""
+    quantized = manager._requantized_copy(model, "int4")
+    for layer in (quantized.self_attn.q_proj, quantized.self_attn.o_proj, quantized.mlp.up_proj.base_layer):
+        assert isinstance(layer, bnb.nn.Linear4bit)
+        assert layer.weight.dtype == torch.uint8
+        assert layer.weight.quant_state is not None
+        assert layer.weight.is_cuda
+
+
+def test_requantized_copy_leaves_original(manager, model):
+    """Readers holding the original model keep the fp16 projections"""
+    q_proj = model.self_attn.q_proj
+    quantized = manager._requantized_copy(model, "int8")
+    assert quantized is not model
+    assert model.self_attn.q_proj is q_proj
+    assert q_proj.weight.dtype == torch.float16
+    assert isinstance(model.mlp.up_proj.base_layer, nn.Linear)
+    x = torch.randn(2, 64, dtype=torch.float16, device="cuda")
+    assert model.self_attn.q_proj(x).dtype == torch.float16